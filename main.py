@@ -8,32 +8,17 @@ render farm, and full CLI automation.
 """
 import sys
 import os
-import socket
-import json
 
 # Add project root and vendored dependencies to path
 _app_root = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, os.path.join(_app_root, "lib"))
 sys.path.insert(0, _app_root)
 
-from src.config import AppConfig
-
-IPC_PORT = 51780
-IPC_HOST = '127.0.0.1'
-
 
 def _try_send_to_running(files):
     """Try to send files to an already running instance. Returns True if successful."""
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        sock.connect((IPC_HOST, IPC_PORT))
-        data = json.dumps({"files": [os.path.abspath(f) for f in files]}).encode('utf-8')
-        sock.sendall(data)
-        sock.close()
-        return True
-    except (ConnectionRefusedError, socket.timeout, OSError):
-        return False
+    from src.utils.ipc import send_files
+    return send_files(files)
 
 
 def run_gui(initial_files=None, add_to_queue_files=None):
@@ -43,104 +28,124 @@ def run_gui(initial_files=None, add_to_queue_files=None):
         if _try_send_to_running(add_to_queue_files):
             return  # Sent to running instance, exit
 
+    # Sibling widgets never overlap (everything sits in layouts), so Qt can
+    # skip subtracting opaque siblings from each widget's paint region
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
+
     from PyQt6.QtWidgets import QApplication
     from src.gui.main_window import MainWindow
     from src.gui.styles import DARK_THEME
+    from src.config import get_config
 
     app = QApplication(sys.argv)
     app.setApplicationName("Moho Render Farm")
     app.setOrganizationName("Damián Turkieh")
     app.setStyleSheet(DARK_THEME)
 
-    config = AppConfig()
+    config = get_config()
     window = MainWindow(config, initial_files=initial_files,
                         add_to_queue_files=add_to_queue_files)
     window.show()
     sys.exit(app.exec())
 
 
+# RenderJob fields set from the yes/no CLI flags of the same name
+_YN_FIELDS = (
+    "multithread", "halfsize", "halffps", "shapefx", "layerfx",
+    "fewparticles", "aa", "extrasmooth", "premultiply", "ntscsafe",
+    "addlayercompsuffix", "createfolderforlayercomps", "addformatsuffix",
+)
+
+
+def _yn(value):
+    """Argparse type for yes/no flags: converts to bool at parse time."""
+    if value not in ("yes", "no"):
+        import argparse
+        raise argparse.ArgumentTypeError(f"invalid choice: '{value}' (choose from 'yes', 'no')")
+    return value == "yes"
+
+
+_YN_OPT = {"type": _yn, "default": None, "metavar": "{yes,no}"}
+
+# (flags, add_argument kwargs) for every CLI option, in --help order
+_CLI_ARGS = (
+    (("--render", "-r"), {"nargs": "+", "metavar": "FILE",
+                          "help": "Render one or more Moho project files immediately"}),
+    (("--add-to-queue",), {"nargs": "+", "metavar": "FILE",
+                           "help": "Add files to the render queue in GUI mode"}),
+    (("--format", "-f"), {"default": None, "help": "Output format (JPEG, PNG, MP4, etc.)"}),
+    (("--options",), {"default": None, "help": "Format preset/codec (e.g. 'MP4 (MPEG4-AAC)')"}),
+    (("--output", "-o"), {"default": None, "help": "Output file or folder"}),
+    (("--start",), {"type": int, "default": None, "help": "Start frame number"}),
+    (("--end",), {"type": int, "default": None, "help": "End frame number"}),
+    (("--moho-path",), {"default": None, "help": "Path to Moho.exe"}),
+    (("--verbose", "-v"), {"action": "store_true", "help": "Verbose output"}),
+    (("--quiet", "-q"), {"action": "store_true", "help": "Quiet mode (no output)"}),
+    (("--log",), {"default": None, "help": "Log file path"}),
+    (("--multithread",), {**_YN_OPT, "help": "Multi-threaded rendering"}),
+    (("--halfsize",), {**_YN_OPT, "help": "Render at half size"}),
+    (("--halffps",), {**_YN_OPT, "help": "Render at half frame rate"}),
+    (("--shapefx",), {**_YN_OPT, "help": "Apply shape effects"}),
+    (("--layerfx",), {**_YN_OPT, "help": "Apply layer effects"}),
+    (("--fewparticles",), {**_YN_OPT, "help": "Reduced particles"}),
+    (("--aa",), {**_YN_OPT, "help": "Antialiased edges"}),
+    (("--extrasmooth",), {**_YN_OPT, "help": "Extra-smooth images"}),
+    (("--premultiply",), {**_YN_OPT, "help": "Premultiply alpha"}),
+    (("--ntscsafe",), {**_YN_OPT, "help": "NTSC safe colors"}),
+    (("--layercomp",), {"default": None, "help": "Layer comp name (or AllComps/AllLayerComps)"}),
+    (("--addlayercompsuffix",), {**_YN_OPT, "help": "Add layer comp suffix"}),
+    (("--createfolderforlayercomps",), {**_YN_OPT, "help": "Create folder for layer comps"}),
+    (("--addformatsuffix",), {**_YN_OPT, "help": "Add format suffix"}),
+    (("--quality",), {"type": int, "default": None, "choices": range(6),
+                      "help": "Quality 0-5 (QT only)"}),
+    (("--depth",), {"type": int, "default": None, "help": "Pixel depth (QT only, e.g. 24 or 32)"}),
+    (("--queue-file",), {"default": None, "help": "Load and process a saved queue file"}),
+    (("--save-queue",), {"default": None,
+                         "help": "Save the queue to a file after adding render files"}),
+    (("--slave",), {"action": "store_true", "help": "Start in slave mode (headless)"}),
+    (("--master-host",), {"default": "localhost", "help": "Master host address for slave mode"}),
+    (("--port",), {"type": int, "default": 5580, "help": "Network port for master/slave"}),
+    (("--register-context-menu",), {"action": "store_true",
+                                    "help": "Register Windows right-click context menu"}),
+    (("--unregister-context-menu",), {"action": "store_true",
+                                      "help": "Remove Windows right-click context menu"}),
+    (("--gui",), {"action": "store_true", "help": "Force GUI mode"}),
+)
+
+_PARSER = None
+
+
+def _get_parser():
+    """Build the argument parser from _CLI_ARGS on first use."""
+    global _PARSER
+    if _PARSER is None:
+        import argparse
+        _PARSER = argparse.ArgumentParser(
+            prog="moho-render-farm",
+            description="Moho Render Farm - Render farm and batch rendering tool for Moho Animation v14. By Damián Turkieh.",
+        )
+        for flags, kwargs in _CLI_ARGS:
+            _PARSER.add_argument(*flags, **kwargs)
+    return _PARSER
+
+
 def main():
     """Main entry point - handles CLI args or launches GUI."""
-    import argparse
-
-    parser = argparse.ArgumentParser(
-        prog="moho-render-farm",
-        description="Moho Render Farm - Render farm and batch rendering tool for Moho Animation v14. By Damián Turkieh.",
-    )
-    parser.add_argument("--render", "-r", nargs="+", metavar="FILE",
-                        help="Render one or more Moho project files immediately")
-    parser.add_argument("--add-to-queue", nargs="+", metavar="FILE",
-                        help="Add files to the render queue in GUI mode")
-    parser.add_argument("--format", "-f", default=None,
-                        help="Output format (JPEG, PNG, MP4, etc.)")
-    parser.add_argument("--options", default=None,
-                        help="Format preset/codec (e.g. 'MP4 (MPEG4-AAC)')")
-    parser.add_argument("--output", "-o", default=None,
-                        help="Output file or folder")
-    parser.add_argument("--start", type=int, default=None,
-                        help="Start frame number")
-    parser.add_argument("--end", type=int, default=None,
-                        help="End frame number")
-    parser.add_argument("--moho-path", default=None,
-                        help="Path to Moho.exe")
-    parser.add_argument("--verbose", "-v", action="store_true",
-                        help="Verbose output")
-    parser.add_argument("--quiet", "-q", action="store_true",
-                        help="Quiet mode (no output)")
-    parser.add_argument("--log", default=None,
-                        help="Log file path")
-    parser.add_argument("--multithread", type=str, default=None,
-                        choices=["yes", "no"], help="Multi-threaded rendering")
-    parser.add_argument("--halfsize", type=str, default=None,
-                        choices=["yes", "no"], help="Render at half size")
-    parser.add_argument("--halffps", type=str, default=None,
-                        choices=["yes", "no"], help="Render at half frame rate")
-    parser.add_argument("--shapefx", type=str, default=None,
-                        choices=["yes", "no"], help="Apply shape effects")
-    parser.add_argument("--layerfx", type=str, default=None,
-                        choices=["yes", "no"], help="Apply layer effects")
-    parser.add_argument("--fewparticles", type=str, default=None,
-                        choices=["yes", "no"], help="Reduced particles")
-    parser.add_argument("--aa", type=str, default=None,
-                        choices=["yes", "no"], help="Antialiased edges")
-    parser.add_argument("--extrasmooth", type=str, default=None,
-                        choices=["yes", "no"], help="Extra-smooth images")
-    parser.add_argument("--premultiply", type=str, default=None,
-                        choices=["yes", "no"], help="Premultiply alpha")
-    parser.add_argument("--ntscsafe", type=str, default=None,
-                        choices=["yes", "no"], help="NTSC safe colors")
-    parser.add_argument("--layercomp", default=None,
-                        help="Layer comp name (or AllComps/AllLayerComps)")
-    parser.add_argument("--addlayercompsuffix", type=str, default=None,
-                        choices=["yes", "no"], help="Add layer comp suffix")
-    parser.add_argument("--createfolderforlayercomps", type=str, default=None,
-                        choices=["yes", "no"], help="Create folder for layer comps")
-    parser.add_argument("--addformatsuffix", type=str, default=None,
-                        choices=["yes", "no"], help="Add format suffix")
-    parser.add_argument("--quality", type=int, default=None,
-                        choices=range(6), help="Quality 0-5 (QT only)")
-    parser.add_argument("--depth", type=int, default=None,
-                        help="Pixel depth (QT only, e.g. 24 or 32)")
-    parser.add_argument("--queue-file", default=None,
-                        help="Load and process a saved queue file")
-    parser.add_argument("--save-queue", default=None,
-                        help="Save the queue to a file after adding render files")
-    parser.add_argument("--slave", action="store_true",
-                        help="Start in slave mode (headless)")
-    parser.add_argument("--master-host", default="localhost",
-                        help="Master host address for slave mode")
-    parser.add_argument("--port", type=int, default=5580,
-                        help="Network port for master/slave")
-    parser.add_argument("--register-context-menu", action="store_true",
-                        help="Register Windows right-click context menu")
-    parser.add_argument("--unregister-context-menu", action="store_true",
-                        help="Remove Windows right-click context menu")
-    parser.add_argument("--gui", action="store_true",
-                        help="Force GUI mode")
-
-    args = parser.parse_args()
-
-    # Handle context menu registration
+    # Fast path for context menu "Add to Queue": hand the files to a running
+    # instance before paying for the full argument parser
+    argv = sys.argv[1:]
+    if "--add-to-queue" in argv:
+        files = []
+        for arg in argv[argv.index("--add-to-queue") + 1:]:
+            if arg.startswith("-"):
+                break
+            files.append(arg)
+        if files and _try_send_to_running(files):
+            return
+
+    args = _get_parser().parse_args()
+
+    # Handle context menu registration (needs no config or GUI)
     if args.register_context_menu:
         from src.utils.context_menu import register_context_menu
         register_context_menu()
@@ -172,29 +177,57 @@ def main():
     )
 
 
-def _yn_to_bool(val):
-    """Convert 'yes'/'no' string to bool or None."""
-    if val is None:
-        return None
-    return val == "yes"
+def _existing_paths(paths):
+    """Return the subset of paths that exist, listing each parent folder once.
+
+    One scandir per folder replaces a stat per file, which matters on
+    network shares where every stat is a round-trip.
+    """
+    by_dir = {}
+    for p in paths:
+        full = os.path.abspath(p)
+        by_dir.setdefault(os.path.dirname(full), []).append((p, full))
+    existing = set()
+    for folder, entries in by_dir.items():
+        try:
+            with os.scandir(folder) as it:
+                names = {os.path.normcase(e.name) for e in it}
+        except OSError:
+            continue
+        for p, full in entries:
+            if os.path.normcase(os.path.basename(full)) in names:
+                existing.add(p)
+    return existing
 
 
 def _run_cli_render(args):
     """Render files from the command line."""
     from src.moho_renderer import RenderJob, MohoRenderer, RenderStatus
+    from src.config import get_config
 
-    config = AppConfig()
+    config = get_config()
     moho_path = args.moho_path or config.moho_path
 
     if not os.path.exists(moho_path):
         print(f"ERROR: Moho executable not found: {moho_path}")
         sys.exit(1)
 
-    renderer = MohoRenderer(moho_path)
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
     failed = 0
+    opts = vars(args)
+    yn_values = {field: opts[field] for field in _YN_FIELDS}
+    existing = _existing_paths(args.render)
+    print_lock = threading.Lock()
+
+    def _print(msg):
+        with print_lock:
+            print(msg)
 
+    jobs = []
     for filepath in args.render:
-        if not os.path.exists(filepath):
+        if filepath not in existing:
             print(f"ERROR: File not found: {filepath}")
             failed += 1
             continue
@@ -213,35 +246,40 @@ def _run_cli_render(args):
         job.quiet = args.quiet
         if args.log:
             job.log_file = args.log
-        job.multithread = _yn_to_bool(args.multithread)
-        job.halfsize = _yn_to_bool(args.halfsize)
-        job.halffps = _yn_to_bool(args.halffps)
-        job.shapefx = _yn_to_bool(args.shapefx)
-        job.layerfx = _yn_to_bool(args.layerfx)
-        job.fewparticles = _yn_to_bool(args.fewparticles)
-        job.aa = _yn_to_bool(args.aa)
-        job.extrasmooth = _yn_to_bool(args.extrasmooth)
-        job.premultiply = _yn_to_bool(args.premultiply)
-        job.ntscsafe = _yn_to_bool(args.ntscsafe)
+        for field, value in yn_values.items():
+            setattr(job, field, value)
         if args.layercomp:
             job.layercomp = args.layercomp
-        job.addlayercompsuffix = _yn_to_bool(args.addlayercompsuffix)
-        job.createfolderforlayercomps = _yn_to_bool(args.createfolderforlayercomps)
-        job.addformatsuffix = _yn_to_bool(args.addformatsuffix)
         job.quality = args.quality
         job.depth = args.depth
+        jobs.append(job)
 
-        print(f"Rendering: {filepath}")
-        result = renderer.render(
+    def _render(job):
+        # One renderer per job: MohoRenderer tracks a single process
+        _print(f"Rendering: {job.project_file}")
+        result = MohoRenderer(moho_path).render(
             job,
-            on_output=lambda msg: print(msg) if not args.quiet else None,
+            on_output=_print if not args.quiet else None,
         )
-
         if result.status == RenderStatus.COMPLETED.value:
-            print(f"Completed: {filepath} ({result.elapsed_str})")
-        else:
-            print(f"FAILED: {filepath} - {result.error_message}")
-            failed += 1
+            _print(f"Completed: {job.project_file} ({result.elapsed_str})")
+            return True
+        _print(f"FAILED: {job.project_file} - {result.error_message}")
+        return False
+
+    # Render up to max_local_renders files at once, handing each idle
+    # worker the next file
+    max_workers = max(1, config.get("max_local_renders", 1))
+    if args.log and max_workers > 1 and len(jobs) > 1:
+        # Moho writes its -log file and the renderer reads progress back from
+        # it, so concurrent jobs each need their own file
+        stem, suffix = os.path.splitext(args.log)
+        for job in jobs:
+            job.log_file = f"{stem}_{job.id}{suffix}"
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        for ok in pool.map(_render, jobs):
+            if not ok:
+                failed += 1
 
     if failed:
         print(f"\n{failed} job(s) failed")
@@ -253,8 +291,9 @@ def _run_cli_render(args):
 def _run_queue_file(args):
     """Process a saved queue file from CLI."""
     from src.render_queue import RenderQueue
+    from src.config import get_config
 
-    config = AppConfig()
+    config = get_config()
     moho_path = args.moho_path or config.moho_path
 
     if not os.path.exists(moho_path):
@@ -274,10 +313,10 @@ def _run_queue_file(args):
         print(f"ERROR: Failed to load queue: {e}")
         sys.exit(1)
 
-    import time
     queue.start()
-    while queue.is_running:
-        time.sleep(1)
+    # Short wait slices keep Ctrl+C responsive on Windows
+    while not queue.completed_event.wait(1):
+        pass
 
     failed = queue.failed_count
     if failed:
@@ -287,8 +326,9 @@ def _run_queue_file(args):
 def _run_slave_mode(args):
     """Run in headless slave mode."""
     from src.network.slave import SlaveClient
+    from src.config import get_config
 
-    config = AppConfig()
+    config = get_config()
     moho_path = args.moho_path or config.moho_path
     host = args.master_host
     port = args.port
@@ -301,10 +341,9 @@ def _run_slave_mode(args):
 
     slave.start()
 
-    import time
     try:
-        while True:
-            time.sleep(1)
+        while not slave.stopped_event.wait(1):
+            pass
     except KeyboardInterrupt:
         print("\nStopping slave...")
         slave.stop()
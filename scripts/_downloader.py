@@ -0,0 +1,107 @@
+"""Shared download and extraction helpers for the setup scripts."""
+import os
+import shutil
+import threading
+import urllib.request
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+BLOCK_SIZE = 1 << 20  # 1 MiB
+
+
+class _ProgressWriter:
+    """File wrapper that counts bytes written and prints progress once per MiB."""
+
+    def __init__(self, f, total):
+        self._f = f
+        self._total = total
+        self.downloaded = 0
+
+    def write(self, chunk):
+        prev = self.downloaded
+        self.downloaded += len(chunk)
+        if self._total > 0 and (self.downloaded >> 20) != (prev >> 20):
+            self.print_progress()
+        return self._f.write(chunk)
+
+    def print_progress(self):
+        pct = self.downloaded * 100 // self._total
+        mb = self.downloaded / (1024 * 1024)
+        total_mb = self._total / (1024 * 1024)
+        print(f"\r  Progress: {pct}% ({mb:.1f}/{total_mb:.1f} MB)", end="", flush=True)
+
+
+USER_AGENT = "MohoRenderFarm/1.0"
+
+# One opener for the whole setup run, shared by every download
+_opener = urllib.request.build_opener()
+
+
+def download(url, dest, chunk=BLOCK_SIZE, ua=USER_AGENT):
+    """Download a file with progress display, following redirects."""
+    print(f"  Downloading from:\n  {url}")
+    try:
+        req = urllib.request.Request(url, headers={"User-Agent": ua})
+        response = _opener.open(req)
+    except urllib.error.URLError as e:
+        print(f"  ERROR: Could not connect: {e}")
+        return False
+
+    total = int(response.headers.get("Content-Length", 0))
+    with response, open(dest, "wb") as f:
+        writer = _ProgressWriter(f, total)
+        shutil.copyfileobj(response, writer, length=chunk)
+        if total > 0:
+            writer.print_progress()
+    print()
+    if total > 0 and writer.downloaded != total:
+        print(f"  ERROR: Incomplete download ({writer.downloaded} of {total} bytes)")
+        return False
+    return True
+
+
+def member_targets(names, dest):
+    """Map zip member names to paths under dest, like ZipFile.extractall.
+
+    Raises OSError for any member that would land outside dest (absolute
+    paths or ".." components), since the archive comes from the network.
+    """
+    root = os.path.realpath(dest)
+    targets = {}
+    for name in names:
+        target = os.path.realpath(os.path.join(root, name))
+        if os.path.commonpath([root, target]) != root:
+            raise OSError(f"Unsafe path in archive: {name}")
+        targets[name] = target
+    return targets
+
+
+def extract_members(zip_path, targets):
+    """Extract zip members in parallel.
+
+    targets maps member names to destination paths. Each worker thread opens
+    its own ZipFile handle since ZipFile reads are not thread-safe.
+    """
+    local = threading.local()
+    handles = []
+
+    def _extract(item):
+        member, target = item
+        zf = getattr(local, "zf", None)
+        if zf is None:
+            zf = local.zf = zipfile.ZipFile(zip_path, "r")
+            handles.append(zf)
+        if member.endswith("/"):
+            os.makedirs(target, exist_ok=True)
+            return
+        os.makedirs(os.path.dirname(str(target)), exist_ok=True)
+        with zf.open(member) as src, open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst, BLOCK_SIZE)
+
+    try:
+        workers = max(1, min(len(targets), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            list(ex.map(_extract, targets.items()))
+    finally:
+        for zf in handles:
+            zf.close()
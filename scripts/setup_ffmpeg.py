@@ -2,10 +2,10 @@
 import os
 import sys
 import zipfile
-import urllib.request
-import shutil
 from pathlib import Path
 
+from _downloader import download, extract_members
+
 # FFmpeg essentials build from gyan.dev - static, smaller than full build (<100MB per exe)
 FFMPEG_URL = "https://www.gyan.dev/ffmpeg/builds/ffmpeg-release-essentials.zip"
 APP_ROOT = Path(__file__).parent.parent
@@ -13,36 +13,6 @@ FFMPEG_DIR = APP_ROOT / "ffmpeg"
 FFMPEG_ZIP = APP_ROOT / "ffmpeg-download.zip"
 
 
-def download_with_progress(url, dest):
-    """Download a file with progress display, following redirects."""
-    print(f"  Downloading from:\n  {url}")
-    try:
-        req = urllib.request.Request(url, headers={"User-Agent": "MohoRenderFarm/1.0"})
-        response = urllib.request.urlopen(req)
-    except urllib.error.URLError as e:
-        print(f"  ERROR: Could not connect: {e}")
-        return False
-
-    total = int(response.headers.get("Content-Length", 0))
-    downloaded = 0
-    block_size = 1024 * 64  # 64 KB
-
-    with open(dest, "wb") as f:
-        while True:
-            chunk = response.read(block_size)
-            if not chunk:
-                break
-            f.write(chunk)
-            downloaded += len(chunk)
-            if total > 0:
-                pct = downloaded * 100 // total
-                mb = downloaded / (1024 * 1024)
-                total_mb = total / (1024 * 1024)
-                print(f"\r  Progress: {pct}% ({mb:.1f}/{total_mb:.1f} MB)", end="", flush=True)
-    print()
-    return True
-
-
 def setup_ffmpeg():
     """Download and extract FFmpeg if not already present."""
     if (FFMPEG_DIR / "ffmpeg.exe").exists():
@@ -51,7 +21,7 @@ def setup_ffmpeg():
 
     print("  FFmpeg not found. Downloading...")
 
-    if not download_with_progress(FFMPEG_URL, str(FFMPEG_ZIP)):
+    if not download(FFMPEG_URL, str(FFMPEG_ZIP)):
         return False
 
     # Extract - public builds have nested directory structure:
@@ -60,17 +30,18 @@ def setup_ffmpeg():
     try:
         FFMPEG_DIR.mkdir(parents=True, exist_ok=True)
         with zipfile.ZipFile(str(FFMPEG_ZIP), "r") as zf:
-            # Find ffmpeg.exe and ffprobe.exe inside the zip
-            extracted = []
-            for member in zf.namelist():
-                basename = os.path.basename(member)
-                if basename in ("ffmpeg.exe", "ffprobe.exe"):
-                    # Extract directly into FFMPEG_DIR (flatten the path)
-                    target = FFMPEG_DIR / basename
-                    with zf.open(member) as src, open(target, "wb") as dst:
-                        shutil.copyfileobj(src, dst)
-                    extracted.append(basename)
-                    print(f"  Extracted: {basename}")
+            # Index members by basename once, then look up the binaries
+            by_basename = {os.path.basename(n): n for n in zf.namelist()}
+        targets = {}
+        for name in ("ffmpeg.exe", "ffprobe.exe"):
+            member = by_basename.get(name)
+            if member:
+                # Extract directly into FFMPEG_DIR (flatten the path)
+                targets[member] = FFMPEG_DIR / name
+        extract_members(str(FFMPEG_ZIP), targets)
+        extracted = [target.name for target in targets.values()]
+        for name in extracted:
+            print(f"  Extracted: {name}")
     except (zipfile.BadZipFile, OSError) as e:
         print(f"  ERROR: Failed to extract: {e}")
         return False
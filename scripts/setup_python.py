@@ -2,11 +2,12 @@
 import os
 import sys
 import zipfile
-import urllib.request
 import shutil
 import subprocess
 from pathlib import Path
 
+from _downloader import download, extract_members, member_targets
+
 PYTHON_VERSION = "3.10.11"
 PYTHON_URL = f"https://www.python.org/ftp/python/{PYTHON_VERSION}/python-{PYTHON_VERSION}-embed-amd64.zip"
 GETPIP_URL = "https://bootstrap.pypa.io/get-pip.py"
@@ -16,36 +17,6 @@ PYTHON_ZIP = APP_ROOT / "python-download.zip"
 PTH_FILE = PYTHON_DIR / "python310._pth"
 
 
-def download_with_progress(url, dest):
-    """Download a file with progress display."""
-    print(f"  Downloading from:\n  {url}")
-    try:
-        req = urllib.request.Request(url, headers={"User-Agent": "MohoRenderFarm/1.0"})
-        response = urllib.request.urlopen(req)
-    except urllib.error.URLError as e:
-        print(f"  ERROR: Could not connect: {e}")
-        return False
-
-    total = int(response.headers.get("Content-Length", 0))
-    downloaded = 0
-    block_size = 1024 * 64
-
-    with open(dest, "wb") as f:
-        while True:
-            chunk = response.read(block_size)
-            if not chunk:
-                break
-            f.write(chunk)
-            downloaded += len(chunk)
-            if total > 0:
-                pct = downloaded * 100 // total
-                mb = downloaded / (1024 * 1024)
-                total_mb = total / (1024 * 1024)
-                print(f"\r  Progress: {pct}% ({mb:.1f}/{total_mb:.1f} MB)", end="", flush=True)
-    print()
-    return True
-
-
 def setup_python():
     """Download and set up portable Python."""
     python_exe = PYTHON_DIR / "python.exe"
@@ -56,7 +27,7 @@ def setup_python():
 
     # Download Python embeddable package
     print(f"  Downloading Python {PYTHON_VERSION} embeddable package...")
-    if not download_with_progress(PYTHON_URL, str(PYTHON_ZIP)):
+    if not download(PYTHON_URL, str(PYTHON_ZIP)):
         return False
 
     # Extract
@@ -64,7 +35,8 @@ def setup_python():
     try:
         PYTHON_DIR.mkdir(parents=True, exist_ok=True)
         with zipfile.ZipFile(str(PYTHON_ZIP), "r") as zf:
-            zf.extractall(str(PYTHON_DIR))
+            members = zf.namelist()
+        extract_members(str(PYTHON_ZIP), member_targets(members, PYTHON_DIR))
     except (zipfile.BadZipFile, OSError) as e:
         print(f"  ERROR: Failed to extract: {e}")
         return False
@@ -87,7 +59,7 @@ def setup_python():
     # Install pip
     print("  Installing pip...")
     getpip_path = PYTHON_DIR / "get-pip.py"
-    if not download_with_progress(GETPIP_URL, str(getpip_path)):
+    if not download(GETPIP_URL, str(getpip_path)):
         print("  WARNING: Could not download get-pip.py")
         return False
 
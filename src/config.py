@@ -1,7 +1,16 @@
 """Application configuration management."""
 import json
 import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import orjson  # Optional: faster JSON for config load/save
+except ImportError:
+    orjson = None
 
 APP_NAME = "Moho Render Farm"
 APP_VERSION = "1.6.3"
@@ -37,9 +46,10 @@ DEFAULT_CONFIG = {
     "farm_send_sibling_files": False,
     "auto_reconnect_slave": False,
     "farm_renders_dir": "",
+    "last_browse_dir": "",
 }
 
-FORMATS = [
+FORMATS = (
     "JPEG",
     "TGA",
     "BMP",
@@ -48,50 +58,50 @@ FORMATS = [
     "QT",
     "MP4",
     "Animated GIF",
-]
+)
 
-FORMAT_PRESETS = {
-    "MP4": [
+FORMAT_PRESETS = MappingProxyType({
+    "MP4": (
         "MP4 (MPEG4-AAC)",
         "MP4 (H.265-AAC)",
-    ],
-    "QT": [
+    ),
+    "QT": (
         "MOV (ProRes alpha-ALAC)",
         "MOV (PNG alpha-PCM)",
         "MOV (MJPEG-AAC)",
         "MOV (MPEG4-AAC)",
-    ],
-}
+    ),
+})
 
 # Windows-only video presets
-WINDOWS_PRESETS = {
-    "MP4": [
+WINDOWS_PRESETS = MappingProxyType({
+    "MP4": (
         "MP4 (MPEG4-AAC)",
         "MP4 (H.265-AAC)",
-    ],
-    "QT": [
+    ),
+    "QT": (
         "MOV (ProRes alpha-ALAC)",
         "MOV (PNG alpha-PCM)",
         "MOV (MJPEG-AAC)",
         "MOV (MPEG4-AAC)",
-    ],
-    "M4V": [
+    ),
+    "M4V": (
         "M4V (MPEG4-AAC)",
-    ],
-    "AVI": [
+    ),
+    "AVI": (
         "AVI (PNG alpha-PCM)",
         "AVI (MJPEG-PCM)",
         "AVI (Raw-PCM)",
-    ],
-    "ASF": [
+    ),
+    "ASF": (
         "ASF (WMV-WMA)",
         "ASF (Raw-PCM)",
         "ASF (PNG alpha-PCM)",
         "ASF (MJPEG-PCM)",
-    ],
-}
+    ),
+})
 
-RESOLUTIONS = {
+RESOLUTIONS = MappingProxyType({
     "Project Default": None,
     "4K UHD (3840x2160)": (3840, 2160),
     "2K QHD (2560x1440)": (2560, 1440),
@@ -99,9 +109,10 @@ RESOLUTIONS = {
     "HD 720p (1280x720)": (1280, 720),
     "SD 480p (854x480)": (854, 480),
     "SD 360p (640x360)": (640, 360),
-}
+})
 
 MOHO_FILE_EXTENSIONS = [".moho", ".anime", ".anme"]
+MOHO_FILE_EXTENSIONS_SET = frozenset(MOHO_FILE_EXTENSIONS)
 
 # Bug report Discord webhook
 DISCORD_WEBHOOK_URL = "https://discord.com/api/webhooks/1471430444892426280/dLk-_95ylUmIFWqW4Zy4WXtjkD6hSt5xwqh_htK_W3IqbCJUeMKzsomCmfn44I8FdB1E"
@@ -115,62 +126,110 @@ QUALITY_LEVELS = {
     5: "Lossless",
 }
 
+_ensured = set()
+
+RECENT_KEYS = ("recent_projects", "recent_queues")
+SAVE_DELAY = 0.5  # Seconds to coalesce bursts of recent-file saves
+
+
+def ensure_dir(path):
+    """Create a directory on first use, at most once per process."""
+    if path not in _ensured:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        _ensured.add(path)
+    return path
+
 
 class AppConfig:
     """Manages application configuration with persistence."""
 
     def __init__(self):
         self._config = dict(DEFAULT_CONFIG)
-        self._ensure_dirs()
+        self._save_timer = None
+        self._save_lock = threading.RLock()
         self.load()
-
-    def _ensure_dirs(self):
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        QUEUE_DIR.mkdir(parents=True, exist_ok=True)
-        PRESETS_DIR.mkdir(parents=True, exist_ok=True)
+        # Recent lists kept oldest-first so move-to-front is O(1)
+        self._recents = {
+            key: OrderedDict.fromkeys(reversed(self._config.get(key) or []))
+            for key in RECENT_KEYS
+        }
 
     def load(self):
         if CONFIG_FILE.exists():
             try:
-                with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                    saved = json.load(f)
+                with open(CONFIG_FILE, "rb") as f:
+                    raw = f.read()
+                saved = orjson.loads(raw) if orjson else json.loads(raw.decode("utf-8"))
                 for key in DEFAULT_CONFIG:
                     if key in saved:
                         self._config[key] = saved[key]
-            except (json.JSONDecodeError, IOError):
+            except (ValueError, IOError):
                 pass
 
     def save(self):
-        try:
-            with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
-        except IOError:
-            pass
+        # The debounce timer saves from its own thread, so the lock covers the
+        # whole snapshot/serialize/write/replace sequence on the shared tmp file
+        with self._save_lock:
+            self._cancel_scheduled_save()
+            for key, recents in self._recents.items():
+                self._config[key] = list(reversed(recents))
+            if orjson:
+                data = orjson.dumps(self._config)
+            else:
+                data = json.dumps(self._config, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+            # Write to a temp file and swap it in so an interrupted save never
+            # leaves a truncated config behind
+            tmp_file = CONFIG_FILE.with_suffix(".json.tmp")
+            try:
+                ensure_dir(CONFIG_DIR)
+                with open(tmp_file, "wb") as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, CONFIG_FILE)
+            except IOError:
+                pass
+
+    def _schedule_save(self):
+        """Save after SAVE_DELAY, restarting the delay on each call."""
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DELAY, self.save)
+            self._save_timer.start()
+
+    def _cancel_scheduled_save(self):
+        with self._save_lock:
+            if self._save_timer:
+                self._save_timer.cancel()
+                self._save_timer = None
 
     def get(self, key, default=None):
+        if key in self._recents:
+            return list(reversed(self._recents[key]))
         return self._config.get(key, default)
 
     def set(self, key, value):
+        if key in self._recents:
+            self._recents[key] = OrderedDict.fromkeys(reversed(value))
         self._config[key] = value
         self.save()
 
-    def add_recent_project(self, path):
-        recents = self._config.get("recent_projects", [])
+    def _add_recent(self, key, path):
         path = str(path)
-        if path in recents:
-            recents.remove(path)
-        recents.insert(0, path)
-        self._config["recent_projects"] = recents[: self._config["max_recent"]]
-        self.save()
+        with self._save_lock:
+            recents = self._recents[key]
+            recents.pop(path, None)
+            recents[path] = None
+            while len(recents) > self._config["max_recent"]:
+                recents.popitem(last=False)
+        self._schedule_save()
+
+    def add_recent_project(self, path):
+        self._add_recent("recent_projects", path)
 
     def add_recent_queue(self, path):
-        recents = self._config.get("recent_queues", [])
-        path = str(path)
-        if path in recents:
-            recents.remove(path)
-        recents.insert(0, path)
-        self._config["recent_queues"] = recents[: self._config["max_recent"]]
-        self.save()
+        self._add_recent("recent_queues", path)
 
     @property
     def moho_path(self):
@@ -179,3 +238,9 @@ class AppConfig:
     @moho_path.setter
     def moho_path(self, value):
         self.set("moho_path", value)
+
+
+@lru_cache(maxsize=1)
+def get_config():
+    """Return the process-wide AppConfig instance."""
+    return AppConfig()
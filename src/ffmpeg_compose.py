@@ -1,32 +1,205 @@
 """FFmpeg-based layer comp compositing for Moho Render Farm."""
 import os
 import re
+import struct
 import subprocess
-from pathlib import Path
+import threading
+from collections import deque
 from typing import Optional, Callable
 
 # Image extensions supported for layer comp compositing
 IMAGE_EXTENSIONS = ("*.png", "*.jpg", "*.jpeg", "*.tga", "*.bmp")
 
+# Frame number: the last run of digits right before a supported image extension
+_FRAME_RE = re.compile(r"(\d+)(\.(?:png|jpe?g|tga|bmp))$", re.IGNORECASE)
+
+# Hardware H.264 encoders in order of preference: (4:2:0 pixel format,
+# fixed settings, options that take the quality level given as crf)
+HW_ENCODERS = {
+    "h264_nvenc": ("yuv420p", ["-preset", "p4", "-tune", "hq", "-rc", "vbr", "-b:v", "0"],
+                   ("-cq",)),
+    "h264_qsv": ("nv12", ["-preset", "medium"], ("-global_quality",)),
+    "h264_amf": ("yuv420p", ["-quality", "balanced", "-rc", "cqp"], ("-qp_i", "-qp_p")),
+}
+
+# Read buffer for ffmpeg's stderr pipe, so verbose encoders rarely block on writes
+PIPE_BUFFER_SIZE = 1 << 20
+
+# ffmpeg path -> usable hardware encoder name (or None), probed once per process
+_hw_encoder_cache = {}
+
 
 def get_ffmpeg_path():
     """Get the path to the bundled ffmpeg executable."""
     return os.path.join(os.path.dirname(os.path.dirname(__file__)), "ffmpeg", "ffmpeg.exe")
 
 
-def _find_image_sequences(folder: Path):
-    """Find image sequence files in a folder, trying all supported formats."""
-    for ext_glob in IMAGE_EXTENSIONS:
-        files = sorted(folder.glob(ext_glob))
-        if files:
-            return files
-    return []
+def _scan_image_sequence(folder):
+    """Return (first_name, count) for the image sequence in a folder.
+
+    A single scandir pass counts the files of every supported format and
+    tracks the lowest name, without building or sorting a list of paths.
+    Formats are tried in IMAGE_EXTENSIONS order; (None, 0) if none match.
+    """
+    suffixes = [ext[1:] for ext in IMAGE_EXTENSIONS]
+    firsts = {}
+    counts = dict.fromkeys(suffixes, 0)
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                name = entry.name
+                suffix = os.path.splitext(name)[1].lower()
+                if suffix not in counts or name.startswith("."):
+                    continue
+                counts[suffix] += 1
+                if suffix not in firsts or name < firsts[suffix]:
+                    firsts[suffix] = name
+    except OSError:
+        return None, 0
+    for suffix in suffixes:
+        if counts[suffix]:
+            return firsts[suffix], counts[suffix]
+    return None, 0
+
+
+def _grow_pipe(pipe):
+    """Raise the kernel pipe capacity to PIPE_BUFFER_SIZE where supported (Linux)."""
+    try:
+        import fcntl
+        fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, PIPE_BUFFER_SIZE)
+    except (ImportError, AttributeError, OSError):
+        pass  # Windows, or above /proc/sys/fs/pipe-max-size: keep the default
+
+
+def _run_quiet(cmd, timeout=15):
+    """Run a short ffmpeg command, returning the CompletedProcess or None on error."""
+    try:
+        return subprocess.run(
+            cmd, capture_output=True, text=True, timeout=timeout,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def detect_hw_encoder(ffmpeg_path: str) -> Optional[str]:
+    """Return the first working hardware H.264 encoder, or None.
+
+    Being listed by `ffmpeg -encoders` only means the build supports an
+    encoder, so each candidate also gets a one-frame test encode to confirm
+    the GPU and driver are actually present. The result is cached.
+    """
+    if ffmpeg_path in _hw_encoder_cache:
+        return _hw_encoder_cache[ffmpeg_path]
+    found = None
+    result = _run_quiet([ffmpeg_path, "-hide_banner", "-encoders"])
+    if result and result.returncode == 0:
+        for name in HW_ENCODERS:
+            if name not in result.stdout:
+                continue
+            test = _run_quiet([
+                ffmpeg_path, "-hide_banner", "-loglevel", "error",
+                "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                "-frames:v", "1", "-c:v", name, "-f", "null", "-",
+            ])
+            if test and test.returncode == 0:
+                found = name
+                break
+    _hw_encoder_cache[ffmpeg_path] = found
+    return found
+
+
+def _has_image_sequence(folder) -> bool:
+    """Return True as soon as the folder holds one supported image file."""
+    suffixes = tuple(ext[1:] for ext in IMAGE_EXTENSIONS)
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                name = entry.name
+                if name.lower().endswith(suffixes) and not name.startswith("."):
+                    return True
+    except OSError:
+        pass
+    return False
+
+
+def _detect_pattern(first, count):
+    """Detect the ffmpeg-compatible sequence pattern, start number, and frame count."""
+    # Find the last sequence of digits before the extension (the frame number)
+    match = _FRAME_RE.search(first)
+    if match:
+        digits, ext = match.group(1), match.group(2)
+        prefix = first[:match.start(1)]
+        return f"{prefix}%0{len(digits)}d{ext}", int(digits), count
+    return None, 0, 0
+
+
+def _is_opaque_image(path) -> bool:
+    """Return True if the image format guarantees no transparency.
+
+    Only the file header is read: JPEGs, BMP/TGA files without alpha bits
+    and PNGs without an alpha channel or tRNS chunk can never show the
+    layers beneath them. Anything uncertain counts as transparent.
+    """
+    ext = os.path.splitext(str(path))[1].lower()
+    try:
+        with open(path, "rb") as f:
+            if ext in (".jpg", ".jpeg"):
+                return True
+            if ext == ".bmp":
+                header = f.read(30)
+                return len(header) == 30 and struct.unpack("<H", header[28:30])[0] <= 24
+            if ext == ".tga":
+                header = f.read(18)
+                return len(header) == 18 and (header[17] & 0x0F) == 0
+            if ext == ".png":
+                if f.read(8) != b"\x89PNG\r\n\x1a\n":
+                    return False
+                while True:
+                    chunk = f.read(8)
+                    if len(chunk) < 8:
+                        return False
+                    length, ctype = struct.unpack(">I4s", chunk)
+                    if ctype == b"IHDR":
+                        data = f.read(length)
+                        if len(data) < 10 or data[9] not in (0, 2):  # gray / RGB only
+                            return False
+                        f.seek(4, 1)
+                        continue
+                    if ctype == b"tRNS":
+                        return False
+                    if ctype == b"IDAT":
+                        return True
+                    f.seek(length + 4, 1)
+    except OSError:
+        pass
+    return False
+
+
+def _read_progress(pipe, total_frames, on_progress):
+    """Parse ffmpeg's -progress key=value blocks into percentages of total_frames.
+
+    Every block ends with progress=continue (or progress=end on the last one).
+    """
+    frame = 0
+    for line in pipe:
+        key, sep, value = line.strip().partition("=")
+        if key == "frame" and value.isdigit():
+            frame = int(value)
+        elif key == "progress" and total_frames:
+            on_progress(min(100.0, frame * 100.0 / total_frames))
 
 
 def compose_layer_comps(output_dir: str, framerate: int = 24,
                         ffmpeg_path: str = None,
                         on_output: Optional[Callable[[str], None]] = None,
-                        reverse_order: bool = False) -> Optional[str]:
+                        on_progress: Optional[Callable[[float], None]] = None,
+                        reverse_order: bool = False,
+                        preset: str = "medium",
+                        tune: str = "",
+                        crf: int = 18,
+                        threads: int = 0,
+                        hw_encoder: Optional[str] = "auto") -> Optional[str]:
     """Compose all layer comp image sequences into a single MP4.
 
     Default order (alphabetical):
@@ -37,14 +210,24 @@ def compose_layer_comps(output_dir: str, framerate: int = 24,
     - LAST alphabetically = background (bottom layer)
     - FIRST alphabetically = foreground (top layer)
 
-    Supports PNG, JPEG, TGA, and BMP image sequences.
+    Supports PNG, JPEG, TGA, and BMP image sequences. A single layer folder
+    is encoded on its own, without a filter graph.
 
     Args:
         output_dir: Directory containing layer comp subfolders with image sequences
         framerate: Frame rate for the output video
         ffmpeg_path: Path to ffmpeg executable (uses bundled if None)
         on_output: Callback for log messages
+        on_progress: Callback for encode progress (0-100), from ffmpeg's -progress output
         reverse_order: If True, use inverse alphabetical order (last alpha = background)
+        preset: libx264 speed preset (hardware encoders use their own)
+        tune: libx264 tuning ("animation" suits flat cel-shaded content), or ""
+            for none; ignored by hardware encoders
+        crf: libx264 constant rate factor (lower = higher quality); hardware
+            encoders get the same value as their constant-quality level
+        threads: Encoder threads (0 = let ffmpeg use every core)
+        hw_encoder: "auto" to use a detected GPU encoder (NVENC/QSV/AMF),
+            an encoder name from HW_ENCODERS, or None for libx264
 
     Returns:
         Path to the composed MP4 file, or None if failed
@@ -57,56 +240,44 @@ def compose_layer_comps(output_dir: str, framerate: int = 24,
             on_output(f"[ffmpeg] ERROR: ffmpeg not found at {ffmpeg_path}")
         return None
 
-    output_path = Path(output_dir)
-    if not output_path.is_dir():
+    output_dir = os.path.normpath(str(output_dir))
+    if not os.path.isdir(output_dir):
         if on_output:
             on_output(f"[ffmpeg] ERROR: Not a directory: {output_dir}")
-            if output_path.is_file():
+            if os.path.isfile(output_dir):
                 on_output(f"[ffmpeg] HINT: This is a file, not a folder. Select the folder containing layer subfolders.")
         return None
 
-    # Find layer comp subfolders containing image sequences
+    # Find layer comp subfolders containing image sequences; plain str paths
+    # from scandir avoid building a Path object per entry
+    try:
+        with os.scandir(output_dir) as it:
+            subdirs = sorted((e for e in it if e.is_dir(follow_symlinks=False)), key=lambda e: e.name)
+    except OSError as e:
+        if on_output:
+            on_output(f"[ffmpeg] ERROR: Cannot read {output_dir}: {e}")
+        return None
     layer_folders = []
-    for item in sorted(output_path.iterdir()):
-        if item.is_dir():
-            images = _find_image_sequences(item)
-            if images:
-                layer_folders.append((item.name, item, images))
+    for entry in subdirs:
+        first, count = _scan_image_sequence(entry.path)
+        if count:
+            layer_folders.append((entry.name, entry.path, first, *_detect_pattern(first, count)))
 
-    if len(layer_folders) < 2:
+    if not layer_folders:
         if on_output:
-            on_output(f"[ffmpeg] Need at least 2 layer comp folders to compose, found {len(layer_folders)}")
-            if len(layer_folders) == 0:
-                # Check if images are directly in the folder (not in subfolders)
-                direct_images = _find_image_sequences(output_path)
-                if direct_images:
-                    on_output(f"[ffmpeg] HINT: Found {len(direct_images)} images directly in the folder. "
-                              f"Select the PARENT folder that contains layer subfolders.")
-                else:
-                    on_output(f"[ffmpeg] HINT: No image sequences found. Expected subfolders with image sequences.")
+            on_output("[ffmpeg] No layer comp folders found to compose")
+            # Check if images are directly in the folder (not in subfolders)
+            _, direct_count = _scan_image_sequence(output_dir)
+            if direct_count:
+                on_output(f"[ffmpeg] HINT: Found {direct_count} images directly in the folder. "
+                          f"Select the PARENT folder that contains layer subfolders.")
+            else:
+                on_output(f"[ffmpeg] HINT: No image sequences found. Expected subfolders with image sequences.")
         return None
 
-    # Detect the ffmpeg-compatible sequence pattern for a list of image files
-    def _detect_pattern(images):
-        """Detect the ffmpeg-compatible sequence pattern, start number, and frame count."""
-        first = images[0].name
-        ext = images[0].suffix  # .png, .jpg, .tga, .bmp, etc.
-        # Find the last sequence of digits before the extension (the frame number)
-        escaped_ext = re.escape(ext)
-        match = re.search(rf'(\d+){escaped_ext}$', first)
-        if match:
-            digits = match.group(1)
-            num_digits = len(digits)
-            start_number = int(digits)
-            prefix = first[:match.start(1)]
-            return f"{prefix}%0{num_digits}d{ext}", start_number, len(images)
-        return None, 0, 0
-
     if on_output:
         on_output(f"[ffmpeg] Found {len(layer_folders)} layer comp folders to compose:")
-        for name, folder, images in layer_folders:
-            pattern, start_num, count = _detect_pattern(images)
-            first_file = images[0].name if images else "?"
+        for name, folder, first_file, pattern, start_num, count in layer_folders:
             on_output(f"[ffmpeg]   {name}: {count} frames, start={start_num}, pattern={pattern}, first={first_file}")
 
     # Default (alphabetical): A (bg) first, Z (fg) last
@@ -117,29 +288,41 @@ def compose_layer_comps(output_dir: str, framerate: int = 24,
         layers_bg_to_fg = list(layer_folders)  # A (bg) first, Z (fg) last
 
     # Build ffmpeg command
-    cmd = [ffmpeg_path, "-y"]  # -y to overwrite
+    # -y to overwrite; stderr is streamed to the log, so skip the banner and
+    # per-stream dump and keep only warnings and errors
+    cmd = [ffmpeg_path, "-hide_banner", "-loglevel", "warning", "-y"]
 
     # Determine the shortest frame count across all valid layers
     valid_layers = []
-    for name, folder, images in layers_bg_to_fg:
-        pattern, start_num, count = _detect_pattern(images)
+    for name, folder, first_file, pattern, start_num, count in layers_bg_to_fg:
         if pattern is None:
             if on_output:
                 on_output(f"[ffmpeg] WARNING: Could not detect frame pattern in {name}, skipping")
             continue
         valid_layers.append((name, folder, pattern, start_num, count))
 
-    if len(valid_layers) < 2:
+    if not valid_layers:
         if on_output:
             on_output("[ffmpeg] ERROR: Not enough valid layer inputs")
         return None
 
+    # Layers beneath a fully opaque layer can never be seen: drop them so
+    # ffmpeg neither decodes nor overlays them
+    for i in range(len(valid_layers) - 1, 0, -1):
+        name, folder, pattern, start_num, count = valid_layers[i]
+        if _is_opaque_image(os.path.join(folder, pattern % start_num)):
+            if on_output:
+                hidden = ", ".join(n for n, _, _, _, _ in valid_layers[:i])
+                on_output(f"[ffmpeg] {name} is opaque, skipping hidden layers: {hidden}")
+            valid_layers = valid_layers[i:]
+            break
+
     # Use shortest frame count so all inputs match
     min_frames = min(count for _, _, _, _, count in valid_layers)
 
     # Add input for each layer
     for name, folder, pattern, start_num, count in valid_layers:
-        input_path = str(folder / pattern)
+        input_path = os.path.join(folder, pattern)
         cmd.extend([
             "-framerate", str(framerate),
             "-start_number", str(start_num),
@@ -150,56 +333,116 @@ def compose_layer_comps(output_dir: str, framerate: int = 24,
 
     # Build overlay filter chain
     # [0] = background, [1] = next layer, ... [N-1] = foreground
-    if num_inputs == 2:
-        filter_complex = "[0:v][1:v]overlay=0:0:format=auto"
+    # format=yuv420 makes each overlay blend straight into the encoder's
+    # pixel format instead of converting the finished RGBA frame afterwards
+    if num_inputs == 1:
+        filter_complex = ""
+    elif num_inputs == 2:
+        filter_complex = "[0:v][1:v]overlay=0:0:format=yuv420"
     else:
         parts = []
         for i in range(1, num_inputs):
             if i == 1:
-                parts.append(f"[0:v][1:v]overlay=0:0:format=auto[tmp{i}]")
+                parts.append(f"[0:v][1:v]overlay=0:0:format=yuv420[tmp{i}]")
             elif i == num_inputs - 1:
-                parts.append(f"[tmp{i-1}][{i}:v]overlay=0:0:format=auto")
+                parts.append(f"[tmp{i-1}][{i}:v]overlay=0:0:format=yuv420")
             else:
-                parts.append(f"[tmp{i-1}][{i}:v]overlay=0:0:format=auto[tmp{i}]")
+                parts.append(f"[tmp{i-1}][{i}:v]overlay=0:0:format=yuv420[tmp{i}]")
         filter_complex = ";".join(parts)
 
-    composed_name = f"{output_path.name}_composed.mp4"
-    composed_path = str(output_path / composed_name)
+    composed_name = f"{os.path.basename(output_dir)}_composed.mp4"
+    composed_path = os.path.join(output_dir, composed_name)
 
-    cmd.extend([
-        "-filter_complex", filter_complex,
-        "-frames:v", str(min_frames),
-        "-c:v", "libx264",
-        "-pix_fmt", "yuv420p",
-        "-preset", "medium",
-        "-crf", "18",
-        composed_path,
-    ])
+    if filter_complex:
+        # Let libavfilter spread the overlay work over the same cores as the encoder
+        filter_threads = str(threads or os.cpu_count() or 4)
+        cmd.extend([
+            "-filter_complex_threads", filter_threads,
+            "-filter_complex", filter_complex,
+        ])
+    if hw_encoder == "auto":
+        hw_encoder = detect_hw_encoder(ffmpeg_path)
+    cmd.extend(["-frames:v", str(min_frames)])
+    # Always name the output pixel format: a single layer has no overlay to
+    # produce 4:2:0, and players expect it
+    if hw_encoder in HW_ENCODERS:
+        pix_fmt, settings, quality_opts = HW_ENCODERS[hw_encoder]
+        cmd.extend(["-c:v", hw_encoder, "-pix_fmt", pix_fmt, *settings])
+        for opt in quality_opts:
+            cmd.extend([opt, str(crf)])
+    else:
+        cmd.extend([
+            "-c:v", "libx264",
+            "-pix_fmt", "yuv420p",
+            "-preset", preset,
+            "-crf", str(crf),
+            "-threads", str(threads),
+        ])
+        if tune:
+            cmd.extend(["-tune", tune])
+    cmd.append("-nostats")
+    if on_progress:
+        # Structured progress on stdout; stderr is left for diagnostics
+        cmd.extend(["-progress", "pipe:1"])
+    cmd.append(composed_path)
 
     if on_output:
-        on_output(f"[ffmpeg] Compositing {num_inputs} layers ({min_frames} frames @ {framerate}fps)...")
+        if num_inputs == 1:
+            on_output(f"[ffmpeg] Single layer - encoding without compositing ({min_frames} frames @ {framerate}fps)...")
+        else:
+            on_output(f"[ffmpeg] Compositing {num_inputs} layers ({min_frames} frames @ {framerate}fps)...")
         on_output(f"[ffmpeg] Order (bottom to top): {' -> '.join(n for n, _, _, _, _ in valid_layers)}")
         # Log full command for debugging
         cmd_str = " ".join(f'"{c}"' if " " in c else c for c in cmd)
         on_output(f"[ffmpeg] Command: {cmd_str}")
 
     try:
-        result = subprocess.run(
+        # Stream stderr as it arrives; keep only the tail for error reports
+        proc = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE if on_progress else subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
+            encoding="utf-8",
+            errors="replace",
+            bufsize=PIPE_BUFFER_SIZE,
             creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
         )
-        if result.returncode == 0:
+        _grow_pipe(proc.stderr)
+        progress_thread = None
+        if on_progress:
+            progress_thread = threading.Thread(
+                target=_read_progress, args=(proc.stdout, min_frames, on_progress), daemon=True)
+            progress_thread.start()
+        tail = deque(maxlen=40)
+        for line in proc.stderr:
+            line = line.rstrip()
+            if not line:
+                continue
+            tail.append(line)
+            if on_output:
+                on_output(f"[ffmpeg] {line}")
+        proc.wait()
+        if progress_thread:
+            progress_thread.join()
+        if proc.returncode == 0:
             if on_output:
                 on_output(f"[ffmpeg] Composition completed: {composed_path}")
             return composed_path
         else:
-            error = result.stderr[-500:] if len(result.stderr) > 500 else result.stderr
+            error = "\n".join(tail)[-500:]
             if on_output:
-                on_output(f"[ffmpeg] Composition FAILED (exit {result.returncode}): {error}")
+                on_output(f"[ffmpeg] Composition FAILED (exit {proc.returncode}): {error}")
             return None
     except Exception as e:
         if on_output:
             on_output(f"[ffmpeg] ERROR: {e}")
         return None
+
+
+def threads_per_job(max_parallel: int) -> int:
+    """Split the CPU cores evenly between concurrently running ffmpeg jobs."""
+    if max_parallel <= 1:
+        return 0
+    return max(1, (os.cpu_count() or 1) // max_parallel)
+
@@ -1,31 +1,377 @@
 """Main application window for Moho Render Farm."""
 import os
 import sys
-import socket
 import threading
 from datetime import datetime
+from queue import SimpleQueue
 from pathlib import Path
+from types import MappingProxyType
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
     QGroupBox, QLabel, QLineEdit, QPushButton, QComboBox, QCheckBox,
     QSpinBox, QFileDialog, QTableWidget, QTableWidgetItem, QHeaderView,
-    QTextEdit, QSplitter, QStatusBar, QMenuBar, QMenu, QMessageBox,
+    QTextEdit, QPlainTextEdit, QSplitter, QStatusBar, QMenuBar, QMenu, QMessageBox,
     QProgressBar, QFormLayout, QGridLayout, QApplication, QAbstractItemView,
     QDialog, QDialogButtonBox, QInputDialog, QScrollArea,
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QMimeData, QUrl
-from PyQt6.QtGui import QAction, QDragEnterEvent, QDropEvent, QIcon, QShortcut, QKeySequence, QFont, QColor
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QMimeData, QUrl, QFileSystemWatcher
+from PyQt6.QtGui import QAction, QDragEnterEvent, QDropEvent, QIcon, QShortcut, QKeySequence, QFont, QColor, QBrush
 from src.config import (
     AppConfig, APP_NAME, APP_VERSION, APP_AUTHOR,
-    FORMATS, WINDOWS_PRESETS, RESOLUTIONS, MOHO_FILE_EXTENSIONS,
+    FORMATS, WINDOWS_PRESETS, RESOLUTIONS, MOHO_FILE_EXTENSIONS_SET,
     QUALITY_LEVELS, QUEUE_DIR, PRESETS_DIR, CONFIG_DIR,
     DISCORD_WEBHOOK_URL, AUTOSAVE_QUEUE_FILE, DEFAULT_FARM_RENDERS_DIR,
+    ensure_dir, get_config,
 )
 import json
 from src.moho_renderer import RenderJob, RenderStatus
 from src.render_queue import RenderQueue
 from src.gui.styles import DARK_THEME
 
+try:
+    import orjson  # Optional: faster preset parsing
+except ImportError:
+    orjson = None
+
+# Output file extension for each render format
+_EXT_MAP = MappingProxyType({
+    "JPEG": ".jpg", "TGA": ".tga", "BMP": ".bmp",
+    "PNG": ".png", "PSD": ".psd", "QT": ".mov",
+    "MP4": ".mp4", "Animated GIF": ".gif",
+})
+
+# (RenderJob attribute / preset key, checkbox attribute) for the render options
+_OPTION_WIDGETS = (
+    ("verbose", "chk_verbose"),
+    ("multithread", "chk_multithread"),
+    ("halfsize", "chk_halfsize"),
+    ("halffps", "chk_halffps"),
+    ("shapefx", "chk_shapefx"),
+    ("layerfx", "chk_layerfx"),
+    ("fewparticles", "chk_fewparticles"),
+    ("aa", "chk_aa"),
+    ("extrasmooth", "chk_extrasmooth"),
+    ("premultiply", "chk_premultiply"),
+    ("ntscsafe", "chk_ntscsafe"),
+    ("copy_images", "chk_copy_images"),
+)
+# (attribute, label, default, grid row, grid column) for the render options grid
+_OPT_GRID = (
+    ("chk_multithread", "Multi-threaded rendering", True, 0, 0),
+    ("chk_halfsize", "Render at half size", False, 0, 1),
+    ("chk_halffps", "Render at half frame rate", False, 0, 2),
+    ("chk_shapefx", "Apply shape effects", True, 1, 0),
+    ("chk_layerfx", "Apply layer effects", True, 1, 1),
+    ("chk_fewparticles", "Reduced particles", False, 1, 2),
+    ("chk_aa", "Antialiased edges", True, 2, 0),
+    ("chk_extrasmooth", "Extra-smooth images", True, 2, 1),
+    ("chk_premultiply", "Premultiply alpha", True, 2, 2),
+    ("chk_ntscsafe", "NTSC safe colors", False, 3, 0),
+    ("chk_verbose", "Verbose output", True, 3, 1),
+)
+# (RenderJob attribute / preset key, checkbox attribute) for the layer comp options
+_LAYERCOMP_WIDGETS = (
+    ("addlayercompsuffix", "chk_addlayercompsuffix"),
+    ("createfolderforlayercomps", "chk_createfolderforlayercomp"),
+    ("addformatsuffix", "chk_addformatsuffix"),
+    ("compose_layers", "chk_compose_layers"),
+    ("compose_reverse_order", "chk_compose_reverse"),
+)
+
+# Every boolean setting, and its value when a preset file does not list it
+_BOOL_WIDGETS = _OPTION_WIDGETS + _LAYERCOMP_WIDGETS
+_PRESET_BOOL_DEFAULTS = MappingProxyType({
+    "multithread": True, "halfsize": False, "halffps": False,
+    "shapefx": True, "layerfx": True, "fewparticles": False,
+    "aa": True, "extrasmooth": True, "premultiply": True,
+    "ntscsafe": False, "verbose": True, "copy_images": False,
+    "addlayercompsuffix": False, "createfolderforlayercomps": False,
+    "addformatsuffix": False, "compose_layers": False, "compose_reverse_order": False,
+})
+
+# Table text brushes, created once instead of per cell
+_STATUS_BRUSHES = {
+    status: QBrush(QColor(color)) for status, color in (
+        ("pending", "#f9e2af"),
+        ("rendering", "#89b4fa"),
+        ("completed", "#a6e3a1"),
+        ("failed", "#f38ba8"),
+        ("cancelled", "#6c7086"),
+        ("skipped", "#cba6f7"),
+    )
+}
+_SLAVE_STATUS_BRUSHES = {
+    status: QBrush(QColor(color)) for status, color in (
+        ("idle", "#a6e3a1"),       # green
+        ("rendering", "#89b4fa"),  # blue
+        ("offline", "#f38ba8"),    # red
+        ("disabled", "#9399b2"),   # gray
+    )
+}
+# Farm queue statuses are shown upper-cased
+_FARM_STATUS_BRUSHES = {
+    status: QBrush(QColor(color)) for status, color in (
+        ("PENDING", "#f9e2af"),    # yellow
+        ("RESERVED", "#fab387"),   # orange
+        ("RENDERING", "#89b4fa"),  # blue
+        ("COMPLETED", "#a6e3a1"),  # green
+        ("FAILED", "#f38ba8"),     # red
+        ("CANCELLED", "#6c7086"),  # gray
+    )
+}
+_DEFAULT_BRUSH = QBrush(QColor("#cdd6f4"))
+_LINK_BRUSH = QBrush(QColor("#89b4fa"))
+_YES_BRUSH = QBrush(QColor("#a6e3a1"))
+_NO_BRUSH = QBrush(QColor("#f38ba8"))
+
+# Combo index lookups, so selecting a saved value needs no findText/findData scan
+_PRESET_INDEX = MappingProxyType({
+    fmt: {name: i for i, name in enumerate(presets)} for fmt, presets in WINDOWS_PRESETS.items()})
+_QUALITY_INDEX = {val: i for i, val in enumerate(QUALITY_LEVELS)}
+
+# Preset file name -> (st_mtime_ns, parsed dict)
+_PRESET_CACHE = {}
+# (PRESETS_DIR st_mtime_ns, sorted preset names)
+_PRESET_NAMES = (None, [])
+# Set once a QFileSystemWatcher reports PRESETS_DIR changes (see
+# _watch_presets_dir); the cached names then need no mtime check
+_PRESETS_WATCHED = False
+
+
+def _load_preset_cached(path):
+    """Return the parsed preset at path, re-reading it only when its mtime changes.
+
+    Returns None if the file is missing or not valid JSON.
+    """
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    cached = _PRESET_CACHE.get(path.name)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    try:
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson else json.loads(raw.decode("utf-8"))
+    except (ValueError, IOError):
+        return None
+    _PRESET_CACHE[path.name] = (mtime, data)
+    return data
+
+
+def _write_preset(name, data):
+    """Save a preset atomically: write a temp file, then rename it over the old one.
+
+    Raises IOError on failure; a crash mid-write leaves the old preset intact.
+    """
+    ensure_dir(PRESETS_DIR)
+    preset_file = PRESETS_DIR / f"{name}.json"
+    if orjson:
+        blob = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        blob = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    tmp = preset_file.with_suffix(".json.tmp")
+    with open(tmp, "wb") as f:
+        f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, preset_file)
+    _PRESET_CACHE[preset_file.name] = (preset_file.stat().st_mtime_ns, data)
+    # Don't rely on the folder mtime or watcher alone; they may lag the write
+    _forget_preset_names()
+
+
+def _delete_preset_file(name):
+    """Delete a saved preset, if present, and drop it from the preset caches."""
+    preset_file = PRESETS_DIR / f"{name}.json"
+    try:
+        preset_file.unlink()
+    except FileNotFoundError:
+        pass
+    _PRESET_CACHE.pop(preset_file.name, None)
+    _forget_preset_names()
+
+
+def _forget_preset_names():
+    """Make the next _list_presets call re-list PRESETS_DIR."""
+    global _PRESET_NAMES
+    _PRESET_NAMES = (None, [])
+
+
+def _watch_presets_dir(parent):
+    """Watch PRESETS_DIR so preset files added, removed or renamed elsewhere
+    invalidate the name cache. Returns the watcher, or None if the folder
+    doesn't exist yet (listing then falls back to mtime checks).
+    """
+    global _PRESETS_WATCHED
+    if not PRESETS_DIR.is_dir():
+        return None
+    watcher = QFileSystemWatcher([str(PRESETS_DIR)], parent)
+    watcher.directoryChanged.connect(lambda _path: _forget_preset_names())
+    _PRESETS_WATCHED = True
+    return watcher
+
+
+def _preset_from_widgets(w):
+    """Collect the render settings shown in w's widgets as a preset dict.
+
+    w is the main window or the Edit Render Settings dialog; both name their
+    setting widgets the same way.
+    """
+    data = {
+        "format": w.combo_format.currentText(),
+        "options": w.combo_preset.currentText(),
+        "output_dir": w.edit_output_dir.text(),
+        "subfolder_project": w.chk_subfolder_project.isChecked(),
+        "custom_frames": w.chk_custom_frames.isChecked(),
+        "start_frame": w.spin_start_frame.value(),
+        "end_frame": w.spin_end_frame.value(),
+        "layercomp": w.edit_layercomp.text(),
+        "quality": w.combo_quality.currentData(),
+        "depth": w.spin_depth.value(),
+    }
+    for key, widget in _BOOL_WIDGETS:
+        data[key] = getattr(w, widget).isChecked()
+    return data
+
+
+def _apply_preset_to_widgets(w, data):
+    """Show a preset's render settings in w's widgets (see _preset_from_widgets)."""
+    # Output settings. A format change refills combo_preset through its
+    # currentTextChanged handler; an unchanged format keeps the right list
+    w.combo_format.setCurrentText(data.get("format", "MP4"))
+    opts = data.get("options", "")
+    if opts:
+        idx = w._preset_idx.get(opts, -1)
+        if idx >= 0:
+            w.combo_preset.setCurrentIndex(idx)
+    w.edit_output_dir.setText(data.get("output_dir", ""))
+    w.chk_subfolder_project.setChecked(data.get("subfolder_project", False))
+
+    # Frame range
+    custom_frames = data.get("custom_frames", False)
+    w.chk_custom_frames.setChecked(custom_frames)
+    if custom_frames:
+        w.spin_start_frame.setValue(data.get("start_frame", 1))
+        w.spin_end_frame.setValue(data.get("end_frame", 24))
+
+    # Render options
+    for key, widget in _BOOL_WIDGETS:
+        getattr(w, widget).setChecked(data.get(key, _PRESET_BOOL_DEFAULTS[key]))
+
+    # Layer comps
+    lc_value = data.get("layercomp", "")
+    if lc_value.lower() in ("allcomps", "alllayercomps"):
+        w.chk_allcomps.setChecked(True)
+    else:
+        w.chk_allcomps.setChecked(False)
+        w.edit_layercomp.setText(lc_value)
+
+    # QT options
+    idx = _QUALITY_INDEX.get(data.get("quality", 3), -1)
+    if idx >= 0:
+        w.combo_quality.setCurrentIndex(idx)
+    w.spin_depth.setValue(data.get("depth", 24))
+
+
+def _browse_folder(parent, title, current=""):
+    """Ask for a folder, starting where the last folder browse left off.
+
+    Falls back to `current` (the field being edited), then the home folder.
+    Symlinks are not resolved, which saves stat calls on network drives.
+    """
+    config = get_config()
+    start = config.get("last_browse_dir", "") or current or str(Path.home())
+    folder = QFileDialog.getExistingDirectory(
+        parent, title, start,
+        QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks)
+    if folder:
+        config.set("last_browse_dir", folder)
+    return folder
+
+
+def _list_presets():
+    """Return the sorted preset names, re-listing PRESETS_DIR only when it changes."""
+    global _PRESET_NAMES
+    if _PRESETS_WATCHED and _PRESET_NAMES[0] is not None:
+        return _PRESET_NAMES[1]
+    try:
+        mtime = PRESETS_DIR.stat().st_mtime_ns
+    except OSError:
+        return []
+    if _PRESET_NAMES[0] != mtime:
+        # scandir entries carry the file type, and slicing off ".json" avoids
+        # building a Path per preset
+        with os.scandir(PRESETS_DIR) as it:
+            names = [e.name[:-5] for e in it if e.name.endswith(".json") and e.is_file()]
+        names.sort()
+        _PRESET_NAMES = (mtime, names)
+    return _PRESET_NAMES[1]
+
+
+def _fix_row_height(table, min_height=0):
+    """Give every row of a table the same fixed height.
+
+    Fixed sections let the view lay out rows arithmetically instead of asking
+    each row for its size hint.
+    """
+    vh = table.verticalHeader()
+    vh.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+    vh.setDefaultSectionSize(max(table.fontMetrics().height() + 6, min_height))
+
+
+def _iter_moho_files(folder):
+    """Yield the paths of Moho project files under folder, recursively.
+
+    Walks with scandir so file types come from the directory listing, and
+    checks extensions on the name string instead of building Path objects.
+    Like os.walk, a folder's files come before its subfolders and folder
+    symlinks are not followed.
+    """
+    stack = [folder]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    name = entry.name
+                    dot = name.rfind(".")
+                    if dot >= 0 and name[dot:].lower() in MOHO_FILE_EXTENSIONS_SET and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+# Modules imported on first use by farm and context menu actions
+_PREFETCH_MODULES = ("src.network.master", "src.network.slave", "src.utils.context_menu")
+
+
+def _prefetch_modules():
+    """Import the lazily used modules ahead of time (background thread).
+
+    Flask, requests and the registry helpers take a noticeable moment to
+    import; doing it here means the first farm click finds them loaded.
+    """
+    import importlib
+    for name in _PREFETCH_MODULES:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass  # The action itself reports the missing dependency
+
+
+def _append_to_log_view(view, text):
+    """Append text to a log view, following the end only if it was already there."""
+    sb = view.verticalScrollBar()
+    at_end = sb.value() == sb.maximum()
+    view.appendPlainText(text)
+    if at_end:
+        sb.setValue(sb.maximum())
+
 
 class BugReportDialog(QDialog):
     """Dialog for reporting bugs via Discord webhook."""
@@ -108,7 +454,7 @@ class BugReportDialog(QDialog):
             self.chk_include_log.setChecked(True)
             log_row.addWidget(self.chk_include_log)
             lbl_log = QLabel(self._latest_log.name)
-            lbl_log.setStyleSheet("color: #a6adc8;")
+            lbl_log.setObjectName("mutedLabel")
             log_row.addWidget(lbl_log)
         else:
             self.chk_include_log.setEnabled(False)
@@ -314,11 +660,62 @@ class EditSettingsDialog(QDialog):
         preset_layout.addStretch()
         layout.addWidget(preset_group)
 
-        # --- Output Settings ---
+        # --- Settings groups ---
+        # Each group starts empty and disabled; its widgets are built the
+        # first time its "Apply ..." checkbox is ticked (see _ensure_group)
         self.chk_apply_output = QCheckBox("Apply Output Settings")
-        layout.addWidget(self.chk_apply_output)
-
         self.output_group = QGroupBox("Output Settings")
+        self.chk_apply_frames = QCheckBox("Apply Frame Range")
+        self.frame_group = QGroupBox("Frame Range")
+        self.chk_apply_options = QCheckBox("Apply Render Options")
+        self.options_group = QGroupBox("Render Options")
+        self.chk_apply_layercomp = QCheckBox("Apply Layer Comp Settings")
+        self.lc_group = QGroupBox("Layer Compositions")
+        self.chk_apply_qt = QCheckBox("Apply QuickTime Options")
+        self.qt_group = QGroupBox("QuickTime Options (QT format only)")
+
+        # (apply checkbox, group, builder) in display order
+        self._apply_pairs = (
+            (self.chk_apply_output, self.output_group, self._build_output_group),
+            (self.chk_apply_frames, self.frame_group, self._build_frame_group),
+            (self.chk_apply_options, self.options_group, self._build_options_group),
+            (self.chk_apply_layercomp, self.lc_group, self._build_layercomp_group),
+            (self.chk_apply_qt, self.qt_group, self._build_qt_group),
+        )
+        self._built_groups = set()
+        for chk, group, _ in self._apply_pairs:
+            layout.addWidget(chk)
+            group.setEnabled(False)
+            layout.addWidget(group)
+            chk.toggled.connect(lambda on, g=group: self._on_apply_toggled(g, on))
+
+        # --- Buttons ---
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Apply | QDialogButtonBox.StandardButton.Cancel)
+        buttons.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self._apply)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def _on_apply_toggled(self, group, on):
+        if on:
+            self._ensure_group(group)
+        group.setEnabled(on)
+
+    def _ensure_group(self, group):
+        """Build a settings group's widgets if they don't exist yet."""
+        if group in self._built_groups:
+            return
+        self._built_groups.add(group)
+        for _, g, build in self._apply_pairs:
+            if g is group:
+                build()
+                break
+
+    def _ensure_all_groups(self):
+        for _, group, _ in self._apply_pairs:
+            self._ensure_group(group)
+
+    def _build_output_group(self):
+        """Build the Output Settings widgets."""
         output_form = QFormLayout(self.output_group)
 
         self.combo_format = QComboBox()
@@ -343,16 +740,10 @@ class EditSettingsDialog(QDialog):
         self.chk_subfolder_project = QCheckBox("Create subfolder with project name")
         self.chk_subfolder_project.setChecked(True)
         output_form.addRow("", self.chk_subfolder_project)
+        self._populate_output_group(self.jobs[0])
 
-        self.output_group.setEnabled(False)
-        self.chk_apply_output.toggled.connect(self.output_group.setEnabled)
-        layout.addWidget(self.output_group)
-
-        # --- Frame Range ---
-        self.chk_apply_frames = QCheckBox("Apply Frame Range")
-        layout.addWidget(self.chk_apply_frames)
-
-        self.frame_group = QGroupBox("Frame Range")
+    def _build_frame_group(self):
+        """Build the Frame Range widgets."""
         frame_layout = QHBoxLayout(self.frame_group)
 
         self.chk_custom_frames = QCheckBox("Custom frame range")
@@ -372,77 +763,39 @@ class EditSettingsDialog(QDialog):
         self.spin_end_frame.setEnabled(False)
         frame_layout.addWidget(self.spin_end_frame)
 
-        self.chk_custom_frames.toggled.connect(self.spin_start_frame.setEnabled)
-        self.chk_custom_frames.toggled.connect(self.spin_end_frame.setEnabled)
+        self.chk_custom_frames.toggled.connect(self._on_custom_frames_toggled)
         frame_layout.addStretch()
+        self._populate_frame_group(self.jobs[0])
 
-        self.frame_group.setEnabled(False)
-        self.chk_apply_frames.toggled.connect(self.frame_group.setEnabled)
-        layout.addWidget(self.frame_group)
-
-        # --- Render Options ---
-        self.chk_apply_options = QCheckBox("Apply Render Options")
-        layout.addWidget(self.chk_apply_options)
-
-        self.options_group = QGroupBox("Render Options")
+    def _build_options_group(self):
+        """Build the Render Options widgets."""
         options_grid = QGridLayout(self.options_group)
 
-        self.chk_multithread = QCheckBox("Multi-threaded rendering")
-        self.chk_multithread.setChecked(True)
-        self.chk_halfsize = QCheckBox("Render at half size")
-        self.chk_halffps = QCheckBox("Render at half frame rate")
-        self.chk_shapefx = QCheckBox("Apply shape effects")
-        self.chk_shapefx.setChecked(True)
-        self.chk_layerfx = QCheckBox("Apply layer effects")
-        self.chk_layerfx.setChecked(True)
-        self.chk_fewparticles = QCheckBox("Reduced particles")
-        self.chk_aa = QCheckBox("Antialiased edges")
-        self.chk_aa.setChecked(True)
-        self.chk_extrasmooth = QCheckBox("Extra-smooth images")
-        self.chk_extrasmooth.setChecked(True)
-        self.chk_premultiply = QCheckBox("Premultiply alpha")
-        self.chk_premultiply.setChecked(True)
-        self.chk_ntscsafe = QCheckBox("NTSC safe colors")
-        self.chk_verbose = QCheckBox("Verbose output")
-        self.chk_verbose.setChecked(True)
-
-        options_grid.addWidget(self.chk_multithread, 0, 0)
-        options_grid.addWidget(self.chk_halfsize, 0, 1)
-        options_grid.addWidget(self.chk_halffps, 0, 2)
-        options_grid.addWidget(self.chk_shapefx, 1, 0)
-        options_grid.addWidget(self.chk_layerfx, 1, 1)
-        options_grid.addWidget(self.chk_fewparticles, 1, 2)
-        options_grid.addWidget(self.chk_aa, 2, 0)
-        options_grid.addWidget(self.chk_extrasmooth, 2, 1)
-        options_grid.addWidget(self.chk_premultiply, 2, 2)
-        options_grid.addWidget(self.chk_ntscsafe, 3, 0)
-        options_grid.addWidget(self.chk_verbose, 3, 1)
+        # Build the checkboxes in one pass with updates off, so the group
+        # lays out once at the end
+        self.options_group.setUpdatesEnabled(False)
+        for name, label, default, row, col in _OPT_GRID:
+            chk = QCheckBox(label)
+            chk.setChecked(default)
+            setattr(self, name, chk)
+            options_grid.addWidget(chk, row, col)
+        self.options_group.setUpdatesEnabled(True)
 
         self.chk_copy_images = QCheckBox("Copy \\Images to project root (fix offline media)")
         self.chk_copy_images.setChecked(True)
         options_grid.addWidget(self.chk_copy_images, 4, 0, 1, 3)
+        self._populate_options_group(self.jobs[0])
 
-        self.options_group.setEnabled(False)
-        self.chk_apply_options.toggled.connect(self.options_group.setEnabled)
-        layout.addWidget(self.options_group)
-
-        # --- Layer Compositions ---
-        self.chk_apply_layercomp = QCheckBox("Apply Layer Comp Settings")
-        layout.addWidget(self.chk_apply_layercomp)
-
-        self.lc_group = QGroupBox("Layer Compositions")
+    def _build_layercomp_group(self):
+        """Build the Layer Compositions widgets."""
         lc_layout = QFormLayout(self.lc_group)
 
-        lc_row = QHBoxLayout()
         self.chk_allcomps = QCheckBox("Render AllComps")
         self.chk_allcomps.toggled.connect(self._on_allcomps_toggled)
-        lc_row.addWidget(self.chk_allcomps)
-        lc_row.addSpacing(20)
-        lc_row.addWidget(QLabel("Custom Layer Comp:"))
+        lc_layout.addRow("", self.chk_allcomps)
         self.edit_layercomp = QLineEdit()
         self.edit_layercomp.setPlaceholderText("Enter comp name or AllLayerComps")
-        lc_row.addWidget(self.edit_layercomp, 1)
-        lc_layout.addRow("", lc_row)
+        lc_layout.addRow("Custom Layer Comp:", self.edit_layercomp)
 
         self.chk_addlayercompsuffix = QCheckBox("Add layer comp suffix to filename")
         self.chk_addlayercompsuffix.setChecked(True)
@@ -464,16 +817,10 @@ class EditSettingsDialog(QDialog):
         compose_row.addWidget(self.chk_compose_layers)
         compose_row.addWidget(self.chk_compose_reverse)
         lc_layout.addRow("", compose_row)
+        self._populate_layercomp_group(self.jobs[0])
 
-        self.lc_group.setEnabled(False)
-        self.chk_apply_layercomp.toggled.connect(self.lc_group.setEnabled)
-        layout.addWidget(self.lc_group)
-
-        # --- QT Options ---
-        self.chk_apply_qt = QCheckBox("Apply QuickTime Options")
-        layout.addWidget(self.chk_apply_qt)
-
-        self.qt_group = QGroupBox("QuickTime Options (QT format only)")
+    def _build_qt_group(self):
+        """Build the QuickTime Options widgets."""
         qt_layout = QFormLayout(self.qt_group)
 
         self.combo_quality = QComboBox()
@@ -486,16 +833,7 @@ class EditSettingsDialog(QDialog):
         self.spin_depth.setRange(1, 32)
         self.spin_depth.setValue(24)
         qt_layout.addRow("Pixel Depth:", self.spin_depth)
-
-        self.qt_group.setEnabled(False)
-        self.chk_apply_qt.toggled.connect(self.qt_group.setEnabled)
-        layout.addWidget(self.qt_group)
-
-        # --- Buttons ---
-        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Apply | QDialogButtonBox.StandardButton.Cancel)
-        buttons.button(QDialogButtonBox.StandardButton.Apply).clicked.connect(self._apply)
-        buttons.rejected.connect(self.reject)
-        layout.addWidget(buttons)
+        self._populate_qt_group(self.jobs[0])
 
     def _update_presets(self):
         fmt = self.combo_format.currentText()
@@ -504,6 +842,11 @@ class EditSettingsDialog(QDialog):
             self.combo_preset.addItems(WINDOWS_PRESETS[fmt])
         else:
             self.combo_preset.addItem("")
+        self._preset_idx = _PRESET_INDEX.get(fmt, {})
+
+    def _on_custom_frames_toggled(self, checked):
+        self.spin_start_frame.setEnabled(checked)
+        self.spin_end_frame.setEnabled(checked)
 
     def _on_allcomps_toggled(self, checked):
         self.edit_layercomp.setEnabled(not checked)
@@ -513,154 +856,77 @@ class EditSettingsDialog(QDialog):
             self.edit_layercomp.clear()
 
     def _browse_output_dir(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Output Folder")
+        folder = _browse_folder(self, "Select Output Folder", self.edit_output_dir.text())
         if folder:
             self.edit_output_dir.setText(folder)
 
     def _populate_from_jobs(self):
-        """Pre-populate fields from the first job (or single selected job)."""
-        job = self.jobs[0]
+        """For a single job, tick every group (building it from the job's values)."""
+        if len(self.jobs) == 1:
+            for chk, _, _ in self._apply_pairs:
+                chk.setChecked(True)
 
-        # Output
+    def _populate_output_group(self, job):
         self.combo_format.setCurrentText(job.format or "MP4")
         self._update_presets()
         if job.options:
-            idx = self.combo_preset.findText(job.options)
+            idx = self._preset_idx.get(job.options, -1)
             if idx >= 0:
                 self.combo_preset.setCurrentIndex(idx)
         if job.output_path:
             self.edit_output_dir.setText(str(Path(job.output_path).parent))
         self.chk_subfolder_project.setChecked(job.subfolder_project)
 
-        # Frame range
+    def _populate_frame_group(self, job):
         if job.start_frame is not None:
             self.chk_custom_frames.setChecked(True)
             self.spin_start_frame.setValue(job.start_frame)
         if job.end_frame is not None:
             self.spin_end_frame.setValue(job.end_frame)
 
-        # Render options
-        def _set_chk(chk, val):
-            if val is not None:
-                chk.setChecked(val)
-        _set_chk(self.chk_multithread, job.multithread)
-        _set_chk(self.chk_halfsize, job.halfsize)
-        _set_chk(self.chk_halffps, job.halffps)
-        _set_chk(self.chk_shapefx, job.shapefx)
-        _set_chk(self.chk_layerfx, job.layerfx)
-        _set_chk(self.chk_fewparticles, job.fewparticles)
-        _set_chk(self.chk_aa, job.aa)
-        _set_chk(self.chk_extrasmooth, job.extrasmooth)
-        _set_chk(self.chk_premultiply, job.premultiply)
-        _set_chk(self.chk_ntscsafe, job.ntscsafe)
-        self.chk_verbose.setChecked(job.verbose)
-        self.chk_copy_images.setChecked(job.copy_images)
-
-        # Layer comp
+    def _populate_options_group(self, job):
+        for attr, widget in _OPTION_WIDGETS:
+            value = getattr(job, attr)
+            if value is not None:
+                getattr(self, widget).setChecked(value)
+
+    def _populate_layercomp_group(self, job):
         if job.layercomp and job.layercomp.lower() in ("allcomps", "alllayercomps"):
             self.chk_allcomps.setChecked(True)
         elif job.layercomp:
             self.chk_allcomps.setChecked(False)
             self.edit_layercomp.setText(job.layercomp)
-        _set_chk(self.chk_addlayercompsuffix, job.addlayercompsuffix)
-        _set_chk(self.chk_createfolderforlayercomp, job.createfolderforlayercomps)
-        _set_chk(self.chk_addformatsuffix, job.addformatsuffix)
-        self.chk_compose_layers.setChecked(job.compose_layers)
-        self.chk_compose_reverse.setChecked(job.compose_reverse_order)
+        for attr, widget in _LAYERCOMP_WIDGETS:
+            value = getattr(job, attr)
+            if value is not None:
+                getattr(self, widget).setChecked(value)
 
-        # QT
+    def _populate_qt_group(self, job):
         if job.quality is not None:
-            idx = self.combo_quality.findData(job.quality)
+            idx = _QUALITY_INDEX.get(job.quality, -1)
             if idx >= 0:
                 self.combo_quality.setCurrentIndex(idx)
         if job.depth is not None:
             self.spin_depth.setValue(job.depth)
 
-        # For single job, auto-check all groups
-        if len(self.jobs) == 1:
-            self.chk_apply_output.setChecked(True)
-            self.chk_apply_frames.setChecked(True)
-            self.chk_apply_options.setChecked(True)
-            self.chk_apply_layercomp.setChecked(True)
-            self.chk_apply_qt.setChecked(True)
-
     def _load_preset_list(self):
         """Populate the preset combo from saved JSON files."""
-        PRESETS_DIR.mkdir(parents=True, exist_ok=True)
-        for f in sorted(PRESETS_DIR.glob("*.json")):
-            self.combo_render_preset.addItem(f.stem)
+        self.combo_render_preset.addItems(_list_presets())
 
     def _on_preset_selected(self, name):
         """Load preset settings into widgets when selected."""
         if name == "(none)" or not name:
             return
-        preset_file = PRESETS_DIR / f"{name}.json"
-        if not preset_file.exists():
-            return
-        try:
-            with open(preset_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
+        data = _load_preset_cached(PRESETS_DIR / f"{name}.json")
+        if data is None:
             return
-
-        # Output settings
-        self.combo_format.setCurrentText(data.get("format", "MP4"))
-        self._update_presets()
-        opts = data.get("options", "")
-        if opts:
-            idx = self.combo_preset.findText(opts)
-            if idx >= 0:
-                self.combo_preset.setCurrentIndex(idx)
-        self.edit_output_dir.setText(data.get("output_dir", ""))
-        self.chk_subfolder_project.setChecked(data.get("subfolder_project", False))
-
-        # Frame range
-        custom_frames = data.get("custom_frames", False)
-        self.chk_custom_frames.setChecked(custom_frames)
-        if custom_frames:
-            self.spin_start_frame.setValue(data.get("start_frame", 1))
-            self.spin_end_frame.setValue(data.get("end_frame", 24))
-
-        # Render options
-        self.chk_multithread.setChecked(data.get("multithread", True))
-        self.chk_halfsize.setChecked(data.get("halfsize", False))
-        self.chk_halffps.setChecked(data.get("halffps", False))
-        self.chk_shapefx.setChecked(data.get("shapefx", True))
-        self.chk_layerfx.setChecked(data.get("layerfx", True))
-        self.chk_fewparticles.setChecked(data.get("fewparticles", False))
-        self.chk_aa.setChecked(data.get("aa", True))
-        self.chk_extrasmooth.setChecked(data.get("extrasmooth", True))
-        self.chk_premultiply.setChecked(data.get("premultiply", True))
-        self.chk_ntscsafe.setChecked(data.get("ntscsafe", False))
-        self.chk_verbose.setChecked(data.get("verbose", True))
-        self.chk_copy_images.setChecked(data.get("copy_images", False))
-
-        # Layer comps
-        lc_value = data.get("layercomp", "")
-        if lc_value.lower() in ("allcomps", "alllayercomps"):
-            self.chk_allcomps.setChecked(True)
-        else:
-            self.chk_allcomps.setChecked(False)
-            self.edit_layercomp.setText(lc_value)
-        self.chk_addlayercompsuffix.setChecked(data.get("addlayercompsuffix", False))
-        self.chk_createfolderforlayercomp.setChecked(data.get("createfolderforlayercomps", False))
-        self.chk_addformatsuffix.setChecked(data.get("addformatsuffix", False))
-        self.chk_compose_layers.setChecked(data.get("compose_layers", False))
-        self.chk_compose_reverse.setChecked(data.get("compose_reverse_order", False))
-
-        # QT options
-        quality = data.get("quality", 3)
-        idx = self.combo_quality.findData(quality)
-        if idx >= 0:
-            self.combo_quality.setCurrentIndex(idx)
-        self.spin_depth.setValue(data.get("depth", 24))
+        # Every group receives preset values, so they all need widgets
+        self._ensure_all_groups()
+        _apply_preset_to_widgets(self, data)
 
         # Auto-check all Apply groups when loading a preset
-        self.chk_apply_output.setChecked(True)
-        self.chk_apply_frames.setChecked(True)
-        self.chk_apply_options.setChecked(True)
-        self.chk_apply_layercomp.setChecked(True)
-        self.chk_apply_qt.setChecked(True)
+        for chk, _, _ in self._apply_pairs:
+            chk.setChecked(True)
 
     def _save_preset(self):
         """Save current settings as a named preset."""
@@ -668,46 +934,19 @@ class EditSettingsDialog(QDialog):
         if not ok or not name.strip():
             return
         name = name.strip()
-        data = {
-            "format": self.combo_format.currentText(),
-            "options": self.combo_preset.currentText(),
-            "output_dir": self.edit_output_dir.text(),
-            "subfolder_project": self.chk_subfolder_project.isChecked(),
-            "custom_frames": self.chk_custom_frames.isChecked(),
-            "start_frame": self.spin_start_frame.value(),
-            "end_frame": self.spin_end_frame.value(),
-            "multithread": self.chk_multithread.isChecked(),
-            "halfsize": self.chk_halfsize.isChecked(),
-            "halffps": self.chk_halffps.isChecked(),
-            "shapefx": self.chk_shapefx.isChecked(),
-            "layerfx": self.chk_layerfx.isChecked(),
-            "fewparticles": self.chk_fewparticles.isChecked(),
-            "aa": self.chk_aa.isChecked(),
-            "extrasmooth": self.chk_extrasmooth.isChecked(),
-            "premultiply": self.chk_premultiply.isChecked(),
-            "ntscsafe": self.chk_ntscsafe.isChecked(),
-            "verbose": self.chk_verbose.isChecked(),
-            "copy_images": self.chk_copy_images.isChecked(),
-            "layercomp": self.edit_layercomp.text(),
-            "addlayercompsuffix": self.chk_addlayercompsuffix.isChecked(),
-            "createfolderforlayercomps": self.chk_createfolderforlayercomp.isChecked(),
-            "addformatsuffix": self.chk_addformatsuffix.isChecked(),
-            "compose_layers": self.chk_compose_layers.isChecked(),
-            "compose_reverse_order": self.chk_compose_reverse.isChecked(),
-            "quality": self.combo_quality.currentData(),
-            "depth": self.spin_depth.value(),
-        }
-        PRESETS_DIR.mkdir(parents=True, exist_ok=True)
-        preset_file = PRESETS_DIR / f"{name}.json"
+        self._ensure_all_groups()
+        data = _preset_from_widgets(self)
         try:
-            with open(preset_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_preset(name, data)
         except IOError as e:
             QMessageBox.critical(self, "Error", f"Failed to save preset:\n{e}")
             return
+        # The widgets already hold this preset; don't reload it on selection
+        self.combo_render_preset.blockSignals(True)
         if self.combo_render_preset.findText(name) < 0:
             self.combo_render_preset.addItem(name)
         self.combo_render_preset.setCurrentText(name)
+        self.combo_render_preset.blockSignals(False)
 
     def _delete_preset(self):
         """Delete the currently selected preset."""
@@ -721,73 +960,59 @@ class EditSettingsDialog(QDialog):
         )
         if reply != QMessageBox.StandardButton.Yes:
             return
-        preset_file = PRESETS_DIR / f"{name}.json"
-        if preset_file.exists():
-            preset_file.unlink()
+        _delete_preset_file(name)
         idx = self.combo_render_preset.findText(name)
         if idx >= 0:
             self.combo_render_preset.removeItem(idx)
 
     def _apply(self):
         """Apply checked settings to all selected jobs."""
-        ext_map = {
-            "JPEG": ".jpg", "TGA": ".tga", "BMP": ".bmp",
-            "PNG": ".png", "PSD": ".psd", "QT": ".mov",
-            "MP4": ".mp4", "Animated GIF": ".gif",
-        }
+        # Read the widgets once; every job gets the same values
+        updates = {}
+        apply_output = self.chk_apply_output.isChecked()
+        if apply_output:
+            fmt = self.combo_format.currentText()
+            subfolder = self.chk_subfolder_project.isChecked()
+            out_dir = self.edit_output_dir.text()
+            ext = _EXT_MAP.get(fmt, ".mp4")
+            # Join the folder once (adds a trailing separator if missing)
+            out_prefix = os.path.join(out_dir, "")
+            updates["format"] = fmt
+            updates["options"] = self.combo_preset.currentText() or ""
+            updates["subfolder_project"] = subfolder
+
+        if self.chk_apply_frames.isChecked():
+            custom = self.chk_custom_frames.isChecked()
+            updates["start_frame"] = self.spin_start_frame.value() if custom else None
+            updates["end_frame"] = self.spin_end_frame.value() if custom else None
+
+        if self.chk_apply_options.isChecked():
+            for attr, widget in _OPTION_WIDGETS:
+                updates[attr] = getattr(self, widget).isChecked()
+
+        if self.chk_apply_layercomp.isChecked():
+            updates["layercomp"] = self.edit_layercomp.text().strip()
+            for attr, widget in _LAYERCOMP_WIDGETS:
+                updates[attr] = getattr(self, widget).isChecked()
+
+        if self.chk_apply_qt.isChecked():
+            updates["quality"] = self.combo_quality.currentData()
+            depth_val = self.spin_depth.value()
+            updates["depth"] = depth_val if depth_val != 24 else None
 
         for job in self.jobs:
-            if self.chk_apply_output.isChecked():
-                job.format = self.combo_format.currentText()
-                job.options = self.combo_preset.currentText() or ""
-                job.subfolder_project = self.chk_subfolder_project.isChecked()
-                out_dir = self.edit_output_dir.text()
+            for attr, value in updates.items():
+                setattr(job, attr, value)
+            if apply_output:
                 if out_dir:
-                    name = Path(job.project_file).stem
-                    ext = ext_map.get(job.format, ".mp4")
-                    if job.subfolder_project:
-                        job.output_path = os.path.join(out_dir, name, name + ext)
+                    name = os.path.splitext(os.path.basename(job.project_file))[0]
+                    if subfolder:
+                        job.output_path = f"{out_prefix}{name}{os.sep}{name}{ext}"
                     else:
-                        job.output_path = os.path.join(out_dir, name + ext)
+                        job.output_path = f"{out_prefix}{name}{ext}"
                 else:
                     job.output_path = ""
 
-            if self.chk_apply_frames.isChecked():
-                if self.chk_custom_frames.isChecked():
-                    job.start_frame = self.spin_start_frame.value()
-                    job.end_frame = self.spin_end_frame.value()
-                else:
-                    job.start_frame = None
-                    job.end_frame = None
-
-            if self.chk_apply_options.isChecked():
-                job.verbose = self.chk_verbose.isChecked()
-                job.multithread = self.chk_multithread.isChecked()
-                job.halfsize = self.chk_halfsize.isChecked()
-                job.halffps = self.chk_halffps.isChecked()
-                job.shapefx = self.chk_shapefx.isChecked()
-                job.layerfx = self.chk_layerfx.isChecked()
-                job.fewparticles = self.chk_fewparticles.isChecked()
-                job.aa = self.chk_aa.isChecked()
-                job.extrasmooth = self.chk_extrasmooth.isChecked()
-                job.premultiply = self.chk_premultiply.isChecked()
-                job.ntscsafe = self.chk_ntscsafe.isChecked()
-                job.copy_images = self.chk_copy_images.isChecked()
-
-            if self.chk_apply_layercomp.isChecked():
-                lc = self.edit_layercomp.text().strip()
-                job.layercomp = lc if lc else ""
-                job.addlayercompsuffix = self.chk_addlayercompsuffix.isChecked()
-                job.createfolderforlayercomps = self.chk_createfolderforlayercomp.isChecked()
-                job.addformatsuffix = self.chk_addformatsuffix.isChecked()
-                job.compose_layers = self.chk_compose_layers.isChecked()
-                job.compose_reverse_order = self.chk_compose_reverse.isChecked()
-
-            if self.chk_apply_qt.isChecked():
-                job.quality = self.combo_quality.currentData()
-                depth_val = self.spin_depth.value()
-                job.depth = depth_val if depth_val != 24 else None
-
         self.accept()
 
 
@@ -796,41 +1021,81 @@ class MainWindow(QMainWindow):
 
     log_signal = pyqtSignal(str)
     queue_changed_signal = pyqtSignal()
-    progress_signal = pyqtSignal(str, float)  # job_id, progress
     job_status_signal = pyqtSignal(str, str)  # job_id, status
     ipc_files_signal = pyqtSignal(list)  # files from another instance
+    dropped_files_signal = pyqtSignal(list)  # Moho files found in dropped folders
     farm_log_signal = pyqtSignal(str)  # farm-specific log messages
     farm_status_signal = pyqtSignal(str, str)  # text, color for farm status label
     farm_queue_changed_signal = pyqtSignal()  # farm queue needs refresh
+    slaves_changed_signal = pyqtSignal()  # a slave joined, left or changed state
     find_master_signal = pyqtSignal(str)  # found master IP or empty string
     update_check_signal = pyqtSignal(str, bool)  # (version, success)
     slave_force_update_signal = pyqtSignal()  # slave received force update command
+    LOG_MAX_LINES = 5000  # Older lines are dropped from the log views
 
     def __init__(self, config: AppConfig, initial_files=None, add_to_queue_files=None):
         super().__init__()
+        # The theme is one application-wide stylesheet, set once
+        app = QApplication.instance()
+        if app is not None and not app.styleSheet():
+            app.setStyleSheet(DARK_THEME)
         self.config = config
         self.queue = RenderQueue(config.moho_path, max_concurrent=config.get("max_local_renders", 1))
 
+        # Worker threads buffer log lines and progress here; the GUI thread
+        # flushes them on a timer instead of handling one signal per update.
+        # The lock covers both the workers' writes and the GUI thread's swap
+        self._pending_lock = threading.Lock()
+        self._pending_log = []
+        self._pending_progress = {}
+        # Per-row cell values last written to the queue table
+        self._row_cache = []
+        # Job id -> queue table row, rebuilt by _refresh_queue_table
+        self._row_by_id = {}
+        # Set while a coalesced queue refresh is waiting to run
+        self._refresh_pending = False
+        # (slaves_version, alive flags) last drawn in the slaves table
+        self._slaves_drawn = None
+        self._slaves_refresh_pending = False
+        # Per-row cell values last written to the slaves table
+        self._slave_row_cache = []
+        # State for the shared one-second UI tick (see _on_ui_tick)
+        self._tick_count = 0
+        self._render_ticking = False
+        # QFont needs the QApplication, so it can't be a module constant
+        self._link_font = QFont()
+        self._link_font.setUnderline(True)
+
         # Connect queue callbacks via signals for thread safety
         self.queue.on_output = self._emit_log
-        self.queue.on_queue_changed = self._emit_queue_changed
+        self.queue.on_queue_changed = self.queue_changed_signal.emit
         self.queue.on_progress = self._emit_progress
-        self.queue.on_job_started = lambda j: (self._emit_job_status(j.id, "rendering"), self._emit_log(f"[{j.id}] Rendering: {j.project_name}"))
-        self.queue.on_job_completed = lambda j: (self._emit_job_status(j.id, "completed"), self._emit_log(f"[{j.id}] Completed: {j.project_name} ({j.elapsed_str})"))
-        self.queue.on_job_failed = lambda j: (self._emit_job_status(j.id, "failed"), self._emit_log(f"[{j.id}] Failed: {j.project_name} - {j.error_message}"))
+        self.queue.on_job_started = self._emit_job_started
+        self.queue.on_job_completed = self._emit_job_completed
+        self.queue.on_job_failed = self._emit_job_failed
         self.queue.on_queue_completed = self._on_queue_completed
 
         # Network components
         self.master_server = None
         self.slave_client = None
 
+        self._preset_watcher = _watch_presets_dir(self)
         self._setup_ui()
+        # (RenderJob attribute, checkbox) pairs read for every job created
+        self._job_bool_fields = tuple((attr, getattr(self, widget)) for attr, widget in _BOOL_WIDGETS)
         self._connect_signals()
         self._setup_menu()
+        # Only the window itself handles drops; children pass drags up to it
         self.setAcceptDrops(True)
+        self.queue_table.setAcceptDrops(False)
+        self.log_output.setAcceptDrops(False)
         self._start_ipc_server()
         self._init_cpu_monitor()
 
+        self._flush_timer = QTimer(self)
+        self._flush_timer.timeout.connect(self._flush_pending_updates)
+        self._flush_timer.start(100)
+
         # Load default preset if configured
         default_preset = self.config.get("default_preset", "")
         if default_preset:
@@ -843,13 +1108,13 @@ class MainWindow(QMainWindow):
 
         # Handle initial files from command line / context menu
         if initial_files:
-            for f in initial_files:
-                self._add_file_to_queue(f)
+            self._add_files_to_queue(initial_files)
             self._start_queue()
         elif add_to_queue_files:
-            for f in add_to_queue_files:
-                self._add_file_to_queue(f)
+            self._add_files_to_queue(add_to_queue_files)
 
+        # Warm up the farm imports once the window is up
+        QTimer.singleShot(1000, lambda: threading.Thread(target=_prefetch_modules, daemon=True).start())
         # Check for updates after a short delay
         QTimer.singleShot(3000, self._check_update_on_startup)
         # Auto-reconnect as slave if restarting after forced update
@@ -1013,6 +1278,8 @@ class MainWindow(QMainWindow):
         self.queue_table.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.queue_table.setAlternatingRowColors(True)
         self.queue_table.verticalHeader().setVisible(False)
+        # Rows hold a preset combo box, so they must be at least that tall
+        _fix_row_height(self.queue_table, QComboBox().sizeHint().height())
         self.queue_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.queue_table.customContextMenuRequested.connect(self._show_queue_context_menu)
         self.queue_table.cellClicked.connect(self._on_queue_cell_clicked)
@@ -1033,8 +1300,11 @@ class MainWindow(QMainWindow):
         log_header.addWidget(self.btn_clear_log)
         log_layout.addLayout(log_header)
 
-        self.log_output = QTextEdit()
+        self.log_output = QPlainTextEdit()
         self.log_output.setReadOnly(True)
+        self.log_output.setMaximumBlockCount(self.LOG_MAX_LINES)
+        self.log_output.setUndoRedoEnabled(False)
+        self.log_output.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         self.log_output.setMaximumHeight(200)
         log_layout.addWidget(self.log_output)
 
@@ -1126,8 +1396,7 @@ class MainWindow(QMainWindow):
         self.spin_end_frame.setEnabled(False)
         frame_layout.addWidget(self.spin_end_frame)
 
-        self.chk_custom_frames.toggled.connect(self.spin_start_frame.setEnabled)
-        self.chk_custom_frames.toggled.connect(self.spin_end_frame.setEnabled)
+        self.chk_custom_frames.toggled.connect(self._on_custom_frames_toggled)
 
         frame_layout.addStretch()
         layout.addWidget(frame_group)
@@ -1177,16 +1446,12 @@ class MainWindow(QMainWindow):
         lc_group = QGroupBox("Layer Compositions")
         lc_layout = QFormLayout(lc_group)
 
-        lc_row = QHBoxLayout()
         self.chk_allcomps = QCheckBox("Render AllComps")
         self.chk_allcomps.toggled.connect(self._on_allcomps_toggled)
-        lc_row.addWidget(self.chk_allcomps)
-        lc_row.addSpacing(20)
-        lc_row.addWidget(QLabel("Custom Layer Comp:"))
+        lc_layout.addRow("", self.chk_allcomps)
         self.edit_layercomp = QLineEdit()
         self.edit_layercomp.setPlaceholderText("Enter comp name or AllLayerComps")
-        lc_row.addWidget(self.edit_layercomp, 1)
-        lc_layout.addRow("", lc_row)
+        lc_layout.addRow("Custom Layer Comp:", self.edit_layercomp)
 
         self.chk_addlayercompsuffix = QCheckBox("Add layer comp suffix to filename")
         self.chk_addlayercompsuffix.setChecked(True)
@@ -1355,6 +1620,7 @@ class MainWindow(QMainWindow):
         self.slaves_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.slaves_table.setAlternatingRowColors(True)
         self.slaves_table.verticalHeader().setVisible(False)
+        _fix_row_height(self.slaves_table)
         self.slaves_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.slaves_table.customContextMenuRequested.connect(self._show_slave_context_menu)
         slaves_layout.addWidget(self.slaves_table)
@@ -1384,6 +1650,7 @@ class MainWindow(QMainWindow):
         self.farm_queue_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.farm_queue_table.setAlternatingRowColors(True)
         self.farm_queue_table.verticalHeader().setVisible(False)
+        _fix_row_height(self.farm_queue_table)
         self.farm_queue_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.farm_queue_table.customContextMenuRequested.connect(self._show_farm_queue_context_menu)
         self.farm_queue_table.cellClicked.connect(self._on_farm_queue_cell_clicked)
@@ -1438,11 +1705,11 @@ class MainWindow(QMainWindow):
         # Farm stats bar
         stats_layout = QHBoxLayout()
         self.lbl_farm_stats = QLabel("Farm: not running")
-        self.lbl_farm_stats.setStyleSheet("color: #a6adc8;")
+        self.lbl_farm_stats.setObjectName("mutedLabel")
         stats_layout.addWidget(self.lbl_farm_stats)
         stats_layout.addStretch()
         self.lbl_farm_total_time = QLabel("")
-        self.lbl_farm_total_time.setStyleSheet("color: #a6adc8;")
+        self.lbl_farm_total_time.setObjectName("mutedLabel")
         stats_layout.addWidget(self.lbl_farm_total_time)
         layout.addLayout(stats_layout)
 
@@ -1456,8 +1723,11 @@ class MainWindow(QMainWindow):
         self.btn_clear_farm_log.clicked.connect(lambda: self.farm_log.clear())
         log_header.addWidget(self.btn_clear_farm_log)
         farm_log_layout.addLayout(log_header)
-        self.farm_log = QTextEdit()
+        self.farm_log = QPlainTextEdit()
         self.farm_log.setReadOnly(True)
+        self.farm_log.setMaximumBlockCount(self.LOG_MAX_LINES)
+        self.farm_log.setUndoRedoEnabled(False)
+        self.farm_log.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
         farm_log_layout.addWidget(self.farm_log)
         layout.addWidget(farm_log_group)
 
@@ -1643,19 +1913,26 @@ class MainWindow(QMainWindow):
         return scroll
 
     def _connect_signals(self):
-        # Thread-safe signals
-        self.log_signal.connect(self._append_log)
-        self.queue_changed_signal.connect(self._refresh_queue_table)
-        self.queue_changed_signal.connect(self._autosave_queue)
-        self.progress_signal.connect(self._update_job_progress)
-        self.job_status_signal.connect(self._update_job_status)
-        self.ipc_files_signal.connect(self._on_ipc_files)
-        self.farm_log_signal.connect(self._append_farm_log)
-        self.farm_status_signal.connect(self._update_farm_status)
-        self.farm_queue_changed_signal.connect(self._refresh_farm_queue_table)
-        self.find_master_signal.connect(self._on_master_found)
-        self.update_check_signal.connect(self._on_update_result)
-        self.slave_force_update_signal.connect(self._on_slave_force_update)
+        # Thread-safe signals. These carry updates from worker threads, so
+        # they are queued explicitly rather than resolved on every emit
+        queued = Qt.ConnectionType.QueuedConnection
+        for signal, slot in (
+            (self.log_signal, self._append_log),
+            (self.job_status_signal, self._update_job_status),
+            (self.ipc_files_signal, self._on_ipc_files),
+            (self.dropped_files_signal, self._on_dropped_files),
+            (self.farm_log_signal, self._append_farm_log),
+            (self.farm_status_signal, self._update_farm_status),
+            (self.farm_queue_changed_signal, self._refresh_farm_queue_table),
+            (self.slaves_changed_signal, self._schedule_slaves_refresh),
+            (self.find_master_signal, self._on_master_found),
+            (self.update_check_signal, self._on_update_result),
+            (self.slave_force_update_signal, self._on_slave_force_update),
+        ):
+            signal.connect(slot, queued)
+        # Bursts of queue changes (bulk removes, several jobs finishing) are
+        # folded into one refresh per event loop pass
+        self.queue_changed_signal.connect(self._schedule_queue_refresh)
 
         # Queue controls
         self.btn_add_files.clicked.connect(self._add_files)
@@ -1782,16 +2059,27 @@ class MainWindow(QMainWindow):
 
     # --- Signal emitters (called from worker threads) ---
     def _emit_log(self, msg):
-        self.log_signal.emit(msg)
-
-    def _emit_queue_changed(self):
-        self.queue_changed_signal.emit()
+        # Timestamp now so the log keeps emit times
+        timestamp = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
+        with self._pending_lock:
+            self._pending_log.append(f"{timestamp} {msg}")
 
     def _emit_progress(self, job, progress):
-        self.progress_signal.emit(job.id, progress)
+        # Only the latest value per job matters
+        with self._pending_lock:
+            self._pending_progress[job.id] = progress
+
+    def _emit_job_started(self, job):
+        self.job_status_signal.emit(job.id, "rendering")
+        self._emit_log(f"[{job.id}] Rendering: {job.project_name}")
 
-    def _emit_job_status(self, job_id, status):
-        self.job_status_signal.emit(job_id, status)
+    def _emit_job_completed(self, job):
+        self.job_status_signal.emit(job.id, "completed")
+        self._emit_log(f"[{job.id}] Completed: {job.project_name} ({job.elapsed_str})")
+
+    def _emit_job_failed(self, job):
+        self.job_status_signal.emit(job.id, "failed")
+        self._emit_log(f"[{job.id}] Failed: {job.project_name} - {job.error_message}")
 
     def _on_queue_completed(self):
         self._emit_log("All queue jobs completed!")
@@ -1799,19 +2087,39 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(0, self._stop_render_timer)
 
     # --- Slots (run on main thread) ---
+    def _flush_pending_updates(self):
+        """Apply the log lines and progress values buffered since the last tick."""
+        if self._pending_log:
+            self._flush_log()
+        if self._pending_progress:
+            with self._pending_lock:
+                pending, self._pending_progress = self._pending_progress, {}
+            self.queue_table.setUpdatesEnabled(False)
+            try:
+                for job_id, progress in pending.items():
+                    self._update_job_progress(job_id, progress)
+            finally:
+                self.queue_table.setUpdatesEnabled(True)
+
+    def _flush_log(self):
+        with self._pending_lock:
+            lines, self._pending_log = self._pending_log, []
+        self._write_log_lines(lines)
+
     def _append_log(self, msg):
+        # Keep buffered worker lines ahead of this one
+        if self._pending_log:
+            self._flush_log()
         timestamp = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
-        line = f"{timestamp} {msg}"
-        self.log_output.append(line)
-        sb = self.log_output.verticalScrollBar()
-        sb.setValue(sb.maximum())
-        # Auto-save to log file
-        if hasattr(self, '_log_file_handle') and self._log_file_handle:
-            try:
-                self._log_file_handle.write(line + "\n")
-                self._log_file_handle.flush()
-            except (IOError, OSError):
-                pass
+        self._write_log_lines([f"{timestamp} {msg}"])
+
+    def _write_log_lines(self, lines):
+        """Append lines to the log view in one call and save them to the log file."""
+        text = "\n".join(lines)
+        _append_to_log_view(self.log_output, text)
+        # Auto-save to log file; the writer thread does the disk I/O
+        if getattr(self, '_log_writes', None) is not None:
+            self._log_writes.put(text + "\n")
 
     def _update_farm_status(self, text, color):
         """Update the farm status label (thread-safe via signal)."""
@@ -1821,64 +2129,69 @@ class MainWindow(QMainWindow):
     def _append_farm_log(self, msg):
         """Append a timestamped message to the Farm Log."""
         timestamp = datetime.now().strftime("[%Y-%m-%d %H:%M:%S]")
-        line = f"{timestamp} {msg}"
-        self.farm_log.append(line)
-        sb = self.farm_log.verticalScrollBar()
-        sb.setValue(sb.maximum())
+        _append_to_log_view(self.farm_log, f"{timestamp} {msg}")
 
     def _refresh_queue_table(self):
         jobs = self.queue.jobs
-        self.queue_table.setRowCount(len(jobs))
-
-        for row, job in enumerate(jobs):
-            # Status
-            is_compose = not job.project_file and job.compose_layers
-            status_text = "COMPOSE" if (is_compose and job.status == RenderStatus.PENDING.value) else job.status.upper()
-            status_item = QTableWidgetItem(status_text)
-            color_map = {
-                "pending": "#f9e2af",
-                "rendering": "#89b4fa",
-                "completed": "#a6e3a1",
-                "failed": "#f38ba8",
-                "cancelled": "#6c7086",
-                "skipped": "#cba6f7",
-            }
-            status_item.setForeground(QColor(color_map.get(job.status, "#cdd6f4")))
-            self.queue_table.setItem(row, 0, status_item)
-
-            # Project
-            proj_text = job.project_name or "(compose)"
-            proj_item = QTableWidgetItem(proj_text)
-            self.queue_table.setItem(row, 1, proj_item)
-            link_font = QFont()
-            link_font.setUnderline(True)
-            # Format
-            self.queue_table.setItem(row, 2, QTableWidgetItem(f"{job.format}"))
-            # Layer Comp
-            self.queue_table.setItem(row, 3, QTableWidgetItem(job.layercomp or "No"))
-            # Output (clickable)
-            out = job.output_path or "(project folder)"
-            out_item = QTableWidgetItem(out)
-            out_item.setFont(link_font)
-            out_item.setForeground(QColor("#89b4fa"))
-            self.queue_table.setItem(row, 4, out_item)
-            # Progress
-            prog_item = QTableWidgetItem(f"{job.progress:.0f}%")
-            self.queue_table.setItem(row, 5, prog_item)
-            # Time
-            self.queue_table.setItem(row, 6, QTableWidgetItem(job.elapsed_str))
-            # Slave
-            self.queue_table.setItem(row, 7, QTableWidgetItem(job.assigned_slave or "Local"))
-            # Preset (combo box)
-            combo = QComboBox()
-            combo.addItem("(none)")
-            for f in sorted(PRESETS_DIR.glob("*.json")):
-                combo.addItem(f.stem)
-            combo.setCurrentText(job.preset_name or "(none)")
-            combo.currentTextChanged.connect(lambda name, j=job: self._apply_preset_to_job(j, name))
-            self.queue_table.setCellWidget(row, 8, combo)
-            # ID (hidden col 9)
-            self.queue_table.setItem(row, 9, QTableWidgetItem(job.id))
+        table = self.queue_table
+        presets = tuple(_list_presets())
+        cache = self._row_cache
+        # Rebuild all rows without a repaint, signal or re-sort per setItem
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        try:
+            if table.rowCount() != len(jobs):
+                table.setRowCount(len(jobs))
+            del cache[len(jobs):]
+            self._row_by_id = {job.id: row for row, job in enumerate(jobs)}
+
+            for row, job in enumerate(jobs):
+                is_compose = not job.project_file and job.compose_layers
+                status_text = "COMPOSE" if (is_compose and job.status == RenderStatus.PENDING.value) else job.status.upper()
+                values = [
+                    status_text,
+                    job.project_name or "(compose)",
+                    f"{job.format}",
+                    job.layercomp or "No",
+                    job.output_path or "(project folder)",
+                    f"{job.progress:.0f}%",
+                    job.elapsed_str,
+                    job.assigned_slave or "Local",
+                    (job.id, job.preset_name, presets),  # Preset combo inputs
+                    job.id,  # Hidden col 9
+                ]
+                cached = cache[row] if row < len(cache) else None
+                if cached == values:
+                    continue
+                # Only touch the cells whose value changed since the last refresh
+                for col, value in enumerate(values):
+                    if cached is not None and cached[col] == value:
+                        continue
+                    if col == 8:
+                        table.setCellWidget(row, 8, self._make_preset_combo(job, presets))
+                        continue
+                    item = table.item(row, col)
+                    if item is None:
+                        item = QTableWidgetItem(value)
+                        if col == 4:
+                            # Output (clickable)
+                            item.setFont(self._link_font)
+                            item.setForeground(_LINK_BRUSH)
+                        table.setItem(row, col, item)
+                    else:
+                        item.setText(value)
+                    if col == 0:
+                        item.setForeground(_STATUS_BRUSHES.get(job.status, _DEFAULT_BRUSH))
+                if cached is None:
+                    cache.append(values)
+                else:
+                    cache[row] = values
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting)
 
         # Update global progress
         total = self.queue.total_jobs
@@ -1893,18 +2206,50 @@ class MainWindow(QMainWindow):
         )
 
     def _update_job_progress(self, job_id, progress):
-        for row in range(self.queue_table.rowCount()):
-            id_item = self.queue_table.item(row, 9)
-            if id_item and id_item.text() == job_id:
-                self.queue_table.setItem(row, 5, QTableWidgetItem(f"{progress:.0f}%"))
-                # Also update elapsed time
-                job = self.queue.get_job(job_id)
-                if job:
-                    self.queue_table.setItem(row, 6, QTableWidgetItem(job.elapsed_str))
-                break
+        row = self._row_by_id.get(job_id)
+        if row is None:
+            return
+        # Update the existing cell in place rather than replacing the item.
+        # The Time column is left to the once-a-second render timer.
+        self._set_cell_text(row, 5, f"{progress:.0f}%")
+
+    def _set_cell_text(self, row, col, text):
+        """Set a queue table cell's text, reusing its item when it exists."""
+        cached = self._row_cache[row] if row < len(self._row_cache) else None
+        # Most timer ticks change nothing visible; answer those from the cache
+        if cached is not None and cached[col] == text:
+            return
+        item = self.queue_table.item(row, col)
+        if item is None:
+            self.queue_table.setItem(row, col, QTableWidgetItem(text))
+        elif item.text() != text:
+            item.setText(text)
+        # Keep the refresh cache in step with what the cell shows
+        if cached is not None:
+            cached[col] = text
+
+    def _make_preset_combo(self, job, presets):
+        """Build the Preset column combo box for a queue row."""
+        combo = QComboBox()
+        combo.addItem("(none)")
+        combo.addItems(presets)
+        combo.setCurrentText(job.preset_name or "(none)")
+        combo.currentTextChanged.connect(lambda name, j=job: self._apply_preset_to_job(j, name))
+        return combo
 
     def _update_job_status(self, job_id, status):
+        self._schedule_queue_refresh()
+
+    def _schedule_queue_refresh(self):
+        """Refresh and auto-save the queue once the current event is handled."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._on_queue_changed)
+
+    def _on_queue_changed(self):
+        self._refresh_pending = False
         self._refresh_queue_table()
+        self._autosave_queue()
 
     # --- File operations ---
     def _add_files(self):
@@ -1912,33 +2257,38 @@ class MainWindow(QMainWindow):
             self, "Select Moho Projects", "",
             "Moho Projects (*.moho *.anime *.anme);;All Files (*)"
         )
-        for f in files:
-            self._add_file_to_queue(f)
+        count = self._add_files_to_queue(files)
+        if count > 1:
+            self._append_log(f"Added {count} projects")
 
     def _add_folder(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Folder with Moho Projects")
+        folder = _browse_folder(self, "Select Folder with Moho Projects")
         if folder:
-            count = 0
-            for root, dirs, files in os.walk(folder):
-                for f in files:
-                    ext = Path(f).suffix.lower()
-                    if ext in MOHO_FILE_EXTENSIONS:
-                        self._add_file_to_queue(os.path.join(root, f))
-                        count += 1
+            count = self._add_files_to_queue(_iter_moho_files(folder))
             if count == 0:
                 QMessageBox.information(self, "No Projects", "No Moho project files found in the selected folder.")
             else:
                 self._append_log(f"Added {count} project{'s' if count > 1 else ''} from folder: {Path(folder).name}")
 
-    def _add_file_to_queue(self, filepath):
-        job = self._create_job_from_settings(filepath)
+    def _add_files_to_queue(self, filepaths):
+        """Add project files to the queue (or the farm) and return how many.
+
+        Queue jobs go in with one add_jobs call, so the queue table refreshes
+        once per batch rather than once per file.
+        """
+        filepaths = list(filepaths)
+        jobs = [self._create_job_from_settings(f) for f in filepaths]
         if self.chk_auto_send_farm.isChecked() and (self.master_server or self.slave_client):
-            self._submit_job_to_farm(job)
-            self._append_farm_log(f"[GUI] Auto-sent to farm: {Path(filepath).name}")
+            for job in jobs:
+                self._submit_job_to_farm(job)
+                self._append_farm_log(f"[GUI] Auto-sent to farm: {os.path.basename(job.project_file)}")
         else:
-            self.queue.add_job(job)
-            self._append_log(f"Added to queue: {Path(filepath).name}")
-        self.config.add_recent_project(filepath)
+            self.queue.add_jobs(jobs)
+            if len(jobs) == 1:
+                self._append_log(f"Added to queue: {os.path.basename(filepaths[0])}")
+        for f in filepaths:
+            self.config.add_recent_project(f)
+        return len(jobs)
 
     def _create_job_from_settings(self, filepath):
         """Create a RenderJob from current GUI settings."""
@@ -1947,54 +2297,30 @@ class MainWindow(QMainWindow):
         job.format = self.combo_format.currentText()
 
         # Set preset/options for video formats
-        if self.combo_preset.currentText():
-            job.options = self.combo_preset.currentText()
-        else:
-            job.options = ""
+        job.options = self.combo_preset.currentText()
 
         job.subfolder_project = self.chk_subfolder_project.isChecked()
-        if self.edit_output_dir.text():
-            out_dir = self.edit_output_dir.text()
-            name = Path(filepath).stem
-            ext_map = {
-                "JPEG": ".jpg", "TGA": ".tga", "BMP": ".bmp",
-                "PNG": ".png", "PSD": ".psd", "QT": ".mov",
-                "MP4": ".mp4", "Animated GIF": ".gif",
-            }
-            ext = ext_map.get(job.format, ".mp4")
+        out_dir = self.edit_output_dir.text()
+        if out_dir:
+            name = os.path.splitext(os.path.basename(filepath))[0]
+            ext = _EXT_MAP.get(job.format, ".mp4")
             if job.subfolder_project:
-                job.output_path = os.path.join(out_dir, name, name + ext)
+                job.output_path = os.path.join(out_dir, name, f"{name}{ext}")
             else:
-                job.output_path = os.path.join(out_dir, name + ext)
+                job.output_path = os.path.join(out_dir, f"{name}{ext}")
 
         if self.chk_custom_frames.isChecked():
             job.start_frame = self.spin_start_frame.value()
             job.end_frame = self.spin_end_frame.value()
 
-        job.verbose = self.chk_verbose.isChecked()
-        job.multithread = self.chk_multithread.isChecked()
-        job.halfsize = self.chk_halfsize.isChecked()
-        job.halffps = self.chk_halffps.isChecked()
-        job.shapefx = self.chk_shapefx.isChecked()
-        job.layerfx = self.chk_layerfx.isChecked()
-        job.fewparticles = self.chk_fewparticles.isChecked()
-        job.aa = self.chk_aa.isChecked()
-        job.extrasmooth = self.chk_extrasmooth.isChecked()
-        job.premultiply = self.chk_premultiply.isChecked()
-        job.ntscsafe = self.chk_ntscsafe.isChecked()
+        for attr, widget in self._job_bool_fields:
+            setattr(job, attr, widget.isChecked())
 
         lc = self.edit_layercomp.text().strip()
         if lc:
             job.layercomp = lc
-        job.addlayercompsuffix = self.chk_addlayercompsuffix.isChecked()
-        job.createfolderforlayercomps = self.chk_createfolderforlayercomp.isChecked()
-        job.addformatsuffix = self.chk_addformatsuffix.isChecked()
-        job.compose_layers = self.chk_compose_layers.isChecked()
-        job.compose_reverse_order = self.chk_compose_reverse.isChecked()
 
-        job.copy_images = self.chk_copy_images.isChecked()
-
-        if self.combo_format.currentText() == "QT":
+        if job.format == "QT":
             job.quality = self.combo_quality.currentData()
             depth_val = self.spin_depth.value()
             if depth_val != 24:
@@ -2011,24 +2337,57 @@ class MainWindow(QMainWindow):
     def _open_log_file(self):
         """Open a log file for auto-saving output during queue execution."""
         try:
-            log_dir = CONFIG_DIR / "logs"
-            log_dir.mkdir(parents=True, exist_ok=True)
+            log_dir = ensure_dir(CONFIG_DIR / "logs")
             ts = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
             log_path = log_dir / f"queue_{ts}.log"
-            self._log_file_handle = open(log_path, "w", encoding="utf-8")
-            self._append_log(f"Log auto-save: {log_path}")
+            # Large buffer: each flushed batch of log lines becomes one write()
+            handle = open(log_path, "w", encoding="utf-8", buffering=1 << 16)
         except (IOError, OSError) as e:
-            self._log_file_handle = None
             self._append_log(f"Warning: Could not open log file: {e}")
+            return
+        self._close_log_file()
+        self._log_writes = SimpleQueue()
+        self._log_writer = threading.Thread(
+            target=self._drain_log_writes, args=(handle, self._log_writes), daemon=True)
+        self._log_writer.start()
+        self._append_log(f"Log auto-save: {log_path}")
+
+    @staticmethod
+    def _drain_log_writes(handle, writes):
+        """Write queued log text to handle until a None sentinel arrives, then close it.
 
-    def _close_log_file(self):
-        """Close the auto-save log file."""
-        if hasattr(self, '_log_file_handle') and self._log_file_handle:
+        Runs on its own thread so slow disks or network shares never stall the GUI.
+        """
+        while True:
+            text = writes.get()
+            if text is None:
+                break
             try:
-                self._log_file_handle.close()
+                handle.write(text)
+                # Flush once the backlog is written, not per batch
+                if writes.empty():
+                    handle.flush()
             except (IOError, OSError):
                 pass
-            self._log_file_handle = None
+        try:
+            handle.close()
+        except (IOError, OSError):
+            pass
+
+    def _close_log_file(self, wait=None):
+        """Close the auto-save log file.
+
+        The writer thread drains what is queued and closes the handle on its
+        own; pass wait (seconds) to block until it does, as on exit.
+        """
+        if self._pending_log:
+            self._flush_log()
+        if getattr(self, '_log_writes', None) is not None:
+            self._log_writes.put(None)
+            if wait:
+                self._log_writer.join(wait)
+            self._log_writes = None
+            self._log_writer = None
 
     # --- Queue actions ---
     def _start_selected_jobs(self):
@@ -2116,7 +2475,7 @@ class MainWindow(QMainWindow):
     # --- Queue save/load ---
     def _save_queue(self):
         filepath, _ = QFileDialog.getSaveFileName(
-            self, "Save Queue", str(QUEUE_DIR),
+            self, "Save Queue", str(ensure_dir(QUEUE_DIR)),
             "Queue Files (*.json);;All Files (*)"
         )
         if filepath:
@@ -2310,25 +2669,15 @@ class MainWindow(QMainWindow):
         if preset_name == "(none)" or not preset_name:
             job.preset_name = ""
             return
-        preset_file = PRESETS_DIR / f"{preset_name}.json"
-        if not preset_file.exists():
-            return
-        try:
-            with open(preset_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
+        data = _load_preset_cached(PRESETS_DIR / f"{preset_name}.json")
+        if data is None:
             return
         job.preset_name = preset_name
         job.format = data.get("format", job.format)
         job.options = data.get("options", job.options)
         if data.get("output_dir"):
             name = Path(job.project_file).stem if job.project_file else ""
-            ext_map = {
-                "JPEG": ".jpg", "TGA": ".tga", "BMP": ".bmp",
-                "PNG": ".png", "PSD": ".psd", "QT": ".mov",
-                "MP4": ".mp4", "Animated GIF": ".gif",
-            }
-            ext = ext_map.get(job.format, ".mp4")
+            ext = _EXT_MAP.get(job.format, ".mp4")
             subfolder = data.get("subfolder_project", False)
             if subfolder and name:
                 job.output_path = os.path.join(data["output_dir"], name, name + ext)
@@ -2364,44 +2713,42 @@ class MainWindow(QMainWindow):
 
     def _auto_compose(self):
         """Add an FFmpeg compose-only job to the queue."""
-        folder = QFileDialog.getExistingDirectory(
-            self, "Select Folder with Layer Comp Image Sequences")
+        folder = _browse_folder(self, "Select Folder with Layer Comp Image Sequences")
         if not folder:
             return
-        # Validate: must be a directory with at least 2 subfolders containing images
+        # Validate: must be a directory with at least 1 subfolder containing images
         folder_path = Path(folder)
         if not folder_path.is_dir():
             QMessageBox.warning(self, "Invalid Path",
                                 f"Not a directory:\n{folder}")
             return
-        from src.ffmpeg_compose import _find_image_sequences
+        from src.ffmpeg_compose import _has_image_sequence, _scan_image_sequence
         layer_count = sum(1 for item in folder_path.iterdir()
-                          if item.is_dir() and _find_image_sequences(item))
-        if layer_count < 2:
-            msg = f"Found {layer_count} layer folder(s) with images in:\n{folder}\n\n"
-            if layer_count == 0:
-                direct = _find_image_sequences(folder_path)
-                if direct:
-                    msg += (f"Found {len(direct)} images directly in the folder.\n"
-                            f"Select the PARENT folder that contains layer subfolders.")
-                else:
-                    msg += "No image sequences found. Expected subfolders with image sequences (PNG, JPEG, TGA, BMP)."
+                          if item.is_dir() and _has_image_sequence(item))
+        if layer_count == 0:
+            msg = f"Found no layer folders with images in:\n{folder}\n\n"
+            _, direct_count = _scan_image_sequence(folder_path)
+            if direct_count:
+                msg += (f"Found {direct_count} images directly in the folder.\n"
+                        f"Select the PARENT folder that contains layer subfolders.")
             else:
-                msg += "Need at least 2 layer subfolders to compose."
+                msg += "No image sequences found. Expected subfolders with image sequences (PNG, JPEG, TGA, BMP)."
             QMessageBox.warning(self, "Cannot Compose", msg)
             return
-        # Ask for layer order
-        items = [
-            "Alphabetical (A = background, Z = foreground)",
-            "Reverse (Z = background, A = foreground)",
-        ]
-        choice, ok = QInputDialog.getItem(
-            self, "Layer Order",
-            "Select compositing order for layers:",
-            items, 0, False)
-        if not ok:
-            return
-        reverse = (choice == items[1])
+        # Ask for layer order (a single layer is just encoded)
+        reverse = False
+        if layer_count > 1:
+            items = [
+                "Alphabetical (A = background, Z = foreground)",
+                "Reverse (Z = background, A = foreground)",
+            ]
+            choice, ok = QInputDialog.getItem(
+                self, "Layer Order",
+                "Select compositing order for layers:",
+                items, 0, False)
+            if not ok:
+                return
+            reverse = (choice == items[1])
         job = RenderJob()
         job.project_file = ""
         job.output_path = folder
@@ -2415,9 +2762,11 @@ class MainWindow(QMainWindow):
     def _open_in_explorer(self, filepath):
         """Open Windows Explorer at the given path."""
         import subprocess
+        from src.utils.explorer import reveal_in_explorer
         filepath = os.path.normpath(filepath)
         if os.path.isfile(filepath):
-            subprocess.Popen(['explorer', '/select,', filepath])
+            if not reveal_in_explorer(filepath):
+                subprocess.Popen(['explorer', '/select,', filepath])
         elif os.path.isdir(filepath):
             subprocess.Popen(['explorer', filepath])
         else:
@@ -2454,18 +2803,21 @@ class MainWindow(QMainWindow):
 
     def _edit_job_settings(self, jobs):
         """Open the Edit Render Settings dialog for the given jobs."""
+        presets = _list_presets()
         dialog = EditSettingsDialog(jobs, parent=self)
         result = dialog.exec()
-        # Refresh main preset combo in case presets were saved/deleted in dialog
-        current = self.combo_render_preset.currentText()
-        self.combo_render_preset.blockSignals(True)
-        self.combo_render_preset.clear()
-        self.combo_render_preset.addItem("(none)")
-        self._load_preset_list()
-        idx = self.combo_render_preset.findText(current)
-        if idx >= 0:
-            self.combo_render_preset.setCurrentIndex(idx)
-        self.combo_render_preset.blockSignals(False)
+        # Refresh main preset combo if presets were saved/deleted in the dialog.
+        # _list_presets returns the same list object while nothing has changed.
+        if _list_presets() is not presets:
+            current = self.combo_render_preset.currentText()
+            self.combo_render_preset.blockSignals(True)
+            self.combo_render_preset.clear()
+            self.combo_render_preset.addItem("(none)")
+            self._load_preset_list()
+            idx = self.combo_render_preset.findText(current)
+            if idx >= 0:
+                self.combo_render_preset.setCurrentIndex(idx)
+            self.combo_render_preset.blockSignals(False)
         if result == QDialog.DialogCode.Accepted:
             if self.queue.on_queue_changed:
                 self.queue.on_queue_changed()
@@ -2473,34 +2825,47 @@ class MainWindow(QMainWindow):
 
     # --- Drag and drop ---
     def dragEnterEvent(self, event: QDragEnterEvent):
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                path = url.toLocalFile()
-                if Path(path).suffix.lower() in MOHO_FILE_EXTENSIONS:
-                    event.acceptProposedAction()
-                    return
-                if Path(path).is_dir():
-                    event.acceptProposedAction()
-                    return
+        mime = event.mimeData()
+        if not mime.hasUrls():
+            return
+        for url in mime.urls():
+            path = url.toLocalFile()
+            if os.path.splitext(path)[1].lower() in MOHO_FILE_EXTENSIONS_SET or os.path.isdir(path):
+                event.acceptProposedAction()
+                return
 
     def dropEvent(self, event: QDropEvent):
-        count = 0
+        files, folders = [], []
         for url in event.mimeData().urls():
-            path = url.toLocalFile()
-            p = Path(path)
-            if p.is_dir():
-                for f in p.rglob("*"):
-                    if f.suffix.lower() in MOHO_FILE_EXTENSIONS:
-                        self._add_file_to_queue(str(f))
-                        count += 1
-            elif p.suffix.lower() in MOHO_FILE_EXTENSIONS:
-                self._add_file_to_queue(str(p))
-                count += 1
+            # Qt hands back forward slashes; use native separators for the jobs
+            path = os.path.normpath(url.toLocalFile())
+            # Folders first: a folder can be named like a project file
+            if os.path.isdir(path):
+                folders.append(path)
+            elif os.path.splitext(path)[1].lower() in MOHO_FILE_EXTENSIONS_SET:
+                files.append(path)
+        if files:
+            self._on_dropped_files(files)
+        if folders:
+            # Deep folders can take a while to walk; keep the GUI responsive
+            threading.Thread(target=self._scan_dropped_folders, args=(folders,), daemon=True).start()
+        event.acceptProposedAction()
+
+    def _scan_dropped_folders(self, folders):
+        """Collect the Moho files under dropped folders (background thread)."""
+        files = [f for folder in folders for f in _iter_moho_files(folder)]
+        self.dropped_files_signal.emit(files)
+
+    def _on_dropped_files(self, files):
+        count = self._add_files_to_queue(files)
         if count:
             self._append_log(f"Added {count} project{'s' if count > 1 else ''} via drag & drop")
-        event.acceptProposedAction()
 
     # --- AllComps toggle ---
+    def _on_custom_frames_toggled(self, checked):
+        self.spin_start_frame.setEnabled(checked)
+        self.spin_end_frame.setEnabled(checked)
+
     def _on_allcomps_toggled(self, checked):
         self.edit_layercomp.setEnabled(not checked)
         if checked:
@@ -2525,10 +2890,11 @@ class MainWindow(QMainWindow):
             self.combo_preset.addItems(all_presets[fmt])
         else:
             self.combo_preset.addItem("")  # No preset needed for image formats
+        self._preset_idx = _PRESET_INDEX.get(fmt, {})
 
     # --- Browse dialogs ---
     def _browse_output_dir(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Output Folder")
+        folder = _browse_folder(self, "Select Output Folder", self.edit_output_dir.text())
         if folder:
             self.edit_output_dir.setText(folder)
 
@@ -2543,12 +2909,12 @@ class MainWindow(QMainWindow):
             self._append_log(f"Moho path set to: {filepath}")
 
     def _browse_farm_renders_dir(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Farm Renders Folder")
+        folder = _browse_folder(self, "Select Farm Renders Folder", self.edit_farm_renders_dir.text())
         if folder:
             self.edit_farm_renders_dir.setText(folder)
 
     def _browse_default_output(self):
-        folder = QFileDialog.getExistingDirectory(self, "Select Default Output Folder")
+        folder = _browse_folder(self, "Select Default Output Folder", self.edit_default_output.text())
         if folder:
             self.edit_default_output.setText(folder)
 
@@ -2689,11 +3055,12 @@ class MainWindow(QMainWindow):
         port = self.spin_port.value()
         self.master_server = MasterServer(port=port)
         self.master_server.on_output = lambda msg: self.farm_log_signal.emit(f"[MASTER] {msg}")
-        self.master_server.on_slave_connected = lambda s: (self._refresh_slaves(), self.farm_log_signal.emit(f"[MASTER] Slave connected: {s}"))
-        self.master_server.on_slave_disconnected = lambda s: (self._refresh_slaves(), self.farm_log_signal.emit(f"[MASTER] Slave disconnected: {s}"))
+        self.master_server.on_slave_connected = lambda s: (self.slaves_changed_signal.emit(), self.farm_log_signal.emit(f"[MASTER] Slave connected: {s}"))
+        self.master_server.on_slave_disconnected = lambda s: (self.slaves_changed_signal.emit(), self.farm_log_signal.emit(f"[MASTER] Slave disconnected: {s}"))
         self.master_server.on_job_completed = lambda j, s: self.farm_queue_changed_signal.emit()
         self.master_server.on_job_failed = lambda j, s: self.farm_queue_changed_signal.emit()
         self.master_server.on_farm_queue_changed = lambda: self.farm_queue_changed_signal.emit()
+        self.master_server.on_slaves_changed = self.slaves_changed_signal.emit
         self.master_server.start()
 
         self.btn_start_master.setEnabled(False)
@@ -2708,10 +3075,10 @@ class MainWindow(QMainWindow):
         self._append_farm_log(f"[MASTER] Started on {ip}:{port}")
         self.config.set("network_port", port)
 
-        # Timer to refresh slaves table
-        self._slave_timer = QTimer()
-        self._slave_timer.timeout.connect(self._refresh_slaves)
-        self._slave_timer.start(5000)
+        # Slave changes arrive through on_slaves_changed; _on_ui_tick only
+        # checks for slaves going offline, which is time-based (no heartbeat).
+        # The new server's version restarts at 0, so forget the last draw.
+        self._slaves_drawn = None
 
         # Timer to refresh farm queue table
         self._farm_queue_timer = QTimer()
@@ -2724,8 +3091,6 @@ class MainWindow(QMainWindow):
             self._append_farm_log("[MASTER] Stopped")
             self.master_server.stop()
             self.master_server = None
-        if hasattr(self, '_slave_timer'):
-            self._slave_timer.stop()
         if hasattr(self, '_farm_queue_timer'):
             self._farm_queue_timer.stop()
         self.btn_start_master.setEnabled(True)
@@ -3009,37 +3374,77 @@ class MainWindow(QMainWindow):
         self.lbl_farm_total_time.setText("")
         self.farm_queue_table.setRowCount(0)
 
+    def _schedule_slaves_refresh(self):
+        """Redraw the slaves table shortly, once for a burst of slave events."""
+        if not self._slaves_refresh_pending:
+            self._slaves_refresh_pending = True
+            QTimer.singleShot(100, self._refresh_slaves_if_dirty)
+
+    def _refresh_slaves_if_dirty(self):
+        """Redraw the slaves table only if a slave changed or went on/offline."""
+        self._slaves_refresh_pending = False
+        if not self.master_server:
+            return
+        slaves = list(self.master_server.slaves.values())
+        state = (self.master_server.slaves_version, tuple(s.is_alive for s in slaves))
+        if state != self._slaves_drawn:
+            self._refresh_slaves()
+
     def _refresh_slaves(self):
         if not self.master_server:
             return
-        slaves = self.master_server.slaves
-        self.slaves_table.setRowCount(len(slaves))
-        status_colors = {
-            "idle": "#a6e3a1",      # green
-            "rendering": "#89b4fa",  # blue
-            "offline": "#f38ba8",    # red
-            "disabled": "#9399b2",   # gray
-        }
-        for row, (key, slave) in enumerate(slaves.items()):
-            self.slaves_table.setItem(row, 0, QTableWidgetItem(slave.hostname))
-            self.slaves_table.setItem(row, 1, QTableWidgetItem(key))
-            if not slave.is_alive:
-                actual_status = "offline"
-            elif not slave.render_enabled and slave.status != "rendering":
-                actual_status = "disabled"
-            else:
-                actual_status = slave.status
-            status_item = QTableWidgetItem(actual_status)
-            color = status_colors.get(actual_status, "#cdd6f4")
-            status_item.setForeground(QColor(color))
-            self.slaves_table.setItem(row, 2, status_item)
-            self.slaves_table.setItem(row, 3, QTableWidgetItem(slave.current_job_id))
-            self.slaves_table.setItem(row, 4, QTableWidgetItem(str(slave.jobs_completed)))
-            self.slaves_table.setItem(row, 5, QTableWidgetItem(str(slave.jobs_failed)))
-            render_text = "Yes" if slave.render_enabled else "No"
-            render_item = QTableWidgetItem(render_text)
-            render_item.setForeground(QColor("#a6e3a1" if slave.render_enabled else "#f38ba8"))
-            self.slaves_table.setItem(row, 6, render_item)
+        table = self.slaves_table
+        # Snapshot: the server thread adds slaves while we iterate
+        version = self.master_server.slaves_version
+        slaves = list(self.master_server.slaves.items())
+        self._slaves_drawn = (version, tuple(s.is_alive for _, s in slaves))
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        cache = self._slave_row_cache
+        try:
+            if table.rowCount() != len(slaves):
+                table.setRowCount(len(slaves))
+            del cache[len(slaves):]
+            for row, (key, slave) in enumerate(slaves):
+                if not slave.is_alive:
+                    actual_status = "offline"
+                elif not slave.render_enabled and slave.status != "rendering":
+                    actual_status = "disabled"
+                else:
+                    actual_status = slave.status
+                values = (
+                    slave.hostname,
+                    key,
+                    actual_status,
+                    slave.current_job_id,
+                    str(slave.jobs_completed),
+                    str(slave.jobs_failed),
+                    "Yes" if slave.render_enabled else "No",
+                )
+                cached = cache[row] if row < len(cache) else None
+                if cached == values:
+                    continue  # Nothing visible changed for this slave
+                # Reuse the row's items and only touch cells whose text changed
+                for col, text in enumerate(values):
+                    if cached is not None and cached[col] == text:
+                        continue
+                    item = table.item(row, col)
+                    if item is None:
+                        item = QTableWidgetItem(text)
+                        table.setItem(row, col, item)
+                    else:
+                        item.setText(text)
+                    if col == 2:
+                        item.setForeground(_SLAVE_STATUS_BRUSHES.get(actual_status, _DEFAULT_BRUSH))
+                    elif col == 6:
+                        item.setForeground(_YES_BRUSH if slave.render_enabled else _NO_BRUSH)
+                if cached is None:
+                    cache.append(values)
+                else:
+                    cache[row] = values
+        finally:
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
 
     def _refresh_farm_queue_table(self):
         """Refresh the Farm Queue table with all farm jobs."""
@@ -3067,21 +3472,12 @@ class MainWindow(QMainWindow):
         for job in reversed(all_jobs["completed"]):
             display_jobs.append((job.status.upper(), job))
 
-        color_map = {
-            "PENDING": "#f9e2af",     # yellow
-            "RESERVED": "#fab387",    # orange
-            "RENDERING": "#89b4fa",   # blue
-            "COMPLETED": "#a6e3a1",   # green
-            "FAILED": "#f38ba8",      # red
-            "CANCELLED": "#6c7086",   # gray
-        }
-
         self.farm_queue_table.setRowCount(len(display_jobs))
         total_time = 0.0
 
         for row, (status_text, job) in enumerate(display_jobs):
             status_item = QTableWidgetItem(status_text)
-            status_item.setForeground(QColor(color_map.get(status_text, "#cdd6f4")))
+            status_item.setForeground(_FARM_STATUS_BRUSHES.get(status_text, _DEFAULT_BRUSH))
             self.farm_queue_table.setItem(row, 0, status_item)
             self.farm_queue_table.setItem(row, 1, QTableWidgetItem(job.project_name))
             self.farm_queue_table.setItem(row, 2, QTableWidgetItem(job.format))
@@ -3095,7 +3491,7 @@ class MainWindow(QMainWindow):
             elif job.project_file:
                 out_text = os.path.basename(os.path.dirname(job.project_file))
             out_item = QTableWidgetItem(out_text)
-            out_item.setForeground(QColor("#89b4fa"))
+            out_item.setForeground(_LINK_BRUSH)
             self.farm_queue_table.setItem(row, 6, out_item)
             self.farm_queue_table.setItem(row, 7, QTableWidgetItem(job.id))
 
@@ -3136,19 +3532,12 @@ class MainWindow(QMainWindow):
         for job in reversed(completed_jobs):
             display_jobs.append((job.status.upper(), job))
 
-        color_map = {
-            "RENDERING": "#89b4fa",
-            "COMPLETED": "#a6e3a1",
-            "FAILED": "#f38ba8",
-            "CANCELLED": "#6c7086",
-        }
-
         self.farm_queue_table.setRowCount(len(display_jobs))
         total_time = 0.0
 
         for row, (status_text, job) in enumerate(display_jobs):
             status_item = QTableWidgetItem(status_text)
-            status_item.setForeground(QColor(color_map.get(status_text, "#cdd6f4")))
+            status_item.setForeground(_FARM_STATUS_BRUSHES.get(status_text, _DEFAULT_BRUSH))
             self.farm_queue_table.setItem(row, 0, status_item)
             self.farm_queue_table.setItem(row, 1, QTableWidgetItem(job.project_name))
             self.farm_queue_table.setItem(row, 2, QTableWidgetItem(job.format))
@@ -3161,7 +3550,7 @@ class MainWindow(QMainWindow):
             elif job.project_file:
                 out_text = os.path.basename(os.path.dirname(job.project_file))
             out_item = QTableWidgetItem(out_text)
-            out_item.setForeground(QColor("#89b4fa"))
+            out_item.setForeground(_LINK_BRUSH)
             self.farm_queue_table.setItem(row, 6, out_item)
             self.farm_queue_table.setItem(row, 7, QTableWidgetItem(job.id))
 
@@ -3354,18 +3743,14 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Farm Not Running",
                                 "Start the master or slave first before adding jobs to the farm.")
             return
-        folder = QFileDialog.getExistingDirectory(self, "Select Folder with Moho Projects for Farm")
+        folder = _browse_folder(self, "Select Folder with Moho Projects for Farm")
         if folder:
             count = 0
-            for root, dirs, files_list in os.walk(folder):
-                for f in files_list:
-                    ext = Path(f).suffix.lower()
-                    if ext in MOHO_FILE_EXTENSIONS:
-                        filepath = os.path.join(root, f)
-                        job = self._create_job_from_settings(filepath)
-                        self._submit_job_to_farm(job)
-                        self.config.add_recent_project(filepath)
-                        count += 1
+            for filepath in _iter_moho_files(folder):
+                job = self._create_job_from_settings(filepath)
+                self._submit_job_to_farm(job)
+                self.config.add_recent_project(filepath)
+                count += 1
             if count == 0:
                 QMessageBox.information(self, "No Projects", "No Moho project files found in the selected folder.")
             else:
@@ -3685,10 +4070,7 @@ class MainWindow(QMainWindow):
     # --- Render Presets ---
     def _load_preset_list(self):
         """Populate the preset combo from saved JSON files in PRESETS_DIR."""
-        PRESETS_DIR.mkdir(parents=True, exist_ok=True)
-        for f in sorted(PRESETS_DIR.glob("*.json")):
-            name = f.stem
-            self.combo_render_preset.addItem(name)
+        self.combo_render_preset.addItems(_list_presets())
         # Select default preset if configured
         default_name = self.config.get("default_preset", "")
         if default_name:
@@ -3701,68 +4083,13 @@ class MainWindow(QMainWindow):
         """Load preset settings into widgets when a preset is selected."""
         if name == "(none)" or not name:
             return
-        preset_file = PRESETS_DIR / f"{name}.json"
-        if not preset_file.exists():
-            return
-        try:
-            with open(preset_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError):
+        data = _load_preset_cached(PRESETS_DIR / f"{name}.json")
+        if data is None:
             return
 
         self._append_log(f"Loaded preset: {name}")
 
-        # Output settings
-        self.combo_format.setCurrentText(data.get("format", "MP4"))
-        self._update_presets()
-        opts = data.get("options", "")
-        if opts:
-            idx = self.combo_preset.findText(opts)
-            if idx >= 0:
-                self.combo_preset.setCurrentIndex(idx)
-        self.edit_output_dir.setText(data.get("output_dir", ""))
-        self.chk_subfolder_project.setChecked(data.get("subfolder_project", False))
-
-        # Frame range
-        custom_frames = data.get("custom_frames", False)
-        self.chk_custom_frames.setChecked(custom_frames)
-        if custom_frames:
-            self.spin_start_frame.setValue(data.get("start_frame", 1))
-            self.spin_end_frame.setValue(data.get("end_frame", 24))
-
-        # Render options
-        self.chk_multithread.setChecked(data.get("multithread", True))
-        self.chk_halfsize.setChecked(data.get("halfsize", False))
-        self.chk_halffps.setChecked(data.get("halffps", False))
-        self.chk_shapefx.setChecked(data.get("shapefx", True))
-        self.chk_layerfx.setChecked(data.get("layerfx", True))
-        self.chk_fewparticles.setChecked(data.get("fewparticles", False))
-        self.chk_aa.setChecked(data.get("aa", True))
-        self.chk_extrasmooth.setChecked(data.get("extrasmooth", True))
-        self.chk_premultiply.setChecked(data.get("premultiply", True))
-        self.chk_ntscsafe.setChecked(data.get("ntscsafe", False))
-        self.chk_verbose.setChecked(data.get("verbose", True))
-        self.chk_copy_images.setChecked(data.get("copy_images", False))
-
-        # Layer comps
-        lc_value = data.get("layercomp", "")
-        if lc_value.lower() in ("allcomps", "alllayercomps"):
-            self.chk_allcomps.setChecked(True)
-        else:
-            self.chk_allcomps.setChecked(False)
-            self.edit_layercomp.setText(lc_value)
-        self.chk_addlayercompsuffix.setChecked(data.get("addlayercompsuffix", False))
-        self.chk_createfolderforlayercomp.setChecked(data.get("createfolderforlayercomps", False))
-        self.chk_addformatsuffix.setChecked(data.get("addformatsuffix", False))
-        self.chk_compose_layers.setChecked(data.get("compose_layers", False))
-        self.chk_compose_reverse.setChecked(data.get("compose_reverse_order", False))
-
-        # QT options
-        quality = data.get("quality", 3)
-        idx = self.combo_quality.findData(quality)
-        if idx >= 0:
-            self.combo_quality.setCurrentIndex(idx)
-        self.spin_depth.setValue(data.get("depth", 24))
+        _apply_preset_to_widgets(self, data)
 
     def _save_preset(self):
         """Save current render settings as a named preset."""
@@ -3770,47 +4097,18 @@ class MainWindow(QMainWindow):
         if not ok or not name.strip():
             return
         name = name.strip()
-        data = {
-            "format": self.combo_format.currentText(),
-            "options": self.combo_preset.currentText(),
-            "output_dir": self.edit_output_dir.text(),
-            "subfolder_project": self.chk_subfolder_project.isChecked(),
-            "custom_frames": self.chk_custom_frames.isChecked(),
-            "start_frame": self.spin_start_frame.value(),
-            "end_frame": self.spin_end_frame.value(),
-            "multithread": self.chk_multithread.isChecked(),
-            "halfsize": self.chk_halfsize.isChecked(),
-            "halffps": self.chk_halffps.isChecked(),
-            "shapefx": self.chk_shapefx.isChecked(),
-            "layerfx": self.chk_layerfx.isChecked(),
-            "fewparticles": self.chk_fewparticles.isChecked(),
-            "aa": self.chk_aa.isChecked(),
-            "extrasmooth": self.chk_extrasmooth.isChecked(),
-            "premultiply": self.chk_premultiply.isChecked(),
-            "ntscsafe": self.chk_ntscsafe.isChecked(),
-            "verbose": self.chk_verbose.isChecked(),
-            "copy_images": self.chk_copy_images.isChecked(),
-            "layercomp": self.edit_layercomp.text(),
-            "addlayercompsuffix": self.chk_addlayercompsuffix.isChecked(),
-            "createfolderforlayercomps": self.chk_createfolderforlayercomp.isChecked(),
-            "addformatsuffix": self.chk_addformatsuffix.isChecked(),
-            "compose_layers": self.chk_compose_layers.isChecked(),
-            "compose_reverse_order": self.chk_compose_reverse.isChecked(),
-            "quality": self.combo_quality.currentData(),
-            "depth": self.spin_depth.value(),
-        }
-        PRESETS_DIR.mkdir(parents=True, exist_ok=True)
-        preset_file = PRESETS_DIR / f"{name}.json"
+        data = _preset_from_widgets(self)
         try:
-            with open(preset_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_preset(name, data)
         except IOError as e:
             QMessageBox.critical(self, "Error", f"Failed to save preset:\n{e}")
             return
-        # Add to combo if new
+        # The widgets already hold this preset; don't reload it on selection
+        self.combo_render_preset.blockSignals(True)
         if self.combo_render_preset.findText(name) < 0:
             self.combo_render_preset.addItem(name)
         self.combo_render_preset.setCurrentText(name)
+        self.combo_render_preset.blockSignals(False)
         self._append_log(f"Preset saved: {name}")
 
     def _delete_preset(self):
@@ -3825,9 +4123,7 @@ class MainWindow(QMainWindow):
         )
         if reply != QMessageBox.StandardButton.Yes:
             return
-        preset_file = PRESETS_DIR / f"{name}.json"
-        if preset_file.exists():
-            preset_file.unlink()
+        _delete_preset_file(name)
         idx = self.combo_render_preset.findText(name)
         if idx >= 0:
             self.combo_render_preset.removeItem(idx)
@@ -3850,37 +4146,43 @@ class MainWindow(QMainWindow):
 
     # --- Render Timer for real-time table updates ---
     def _start_render_timer(self):
-        """Start a 1-second timer to update Progress and Time columns."""
-        if not hasattr(self, '_render_timer'):
-            self._render_timer = QTimer()
-            self._render_timer.timeout.connect(self._on_render_timer_tick)
-        self._render_timer.start(1000)
+        """Update Progress and Time columns on every UI tick."""
+        self._render_ticking = True
 
     def _stop_render_timer(self):
-        """Stop the render timer and close log file."""
-        if hasattr(self, '_render_timer'):
-            self._render_timer.stop()
+        """Stop the per-tick column updates and close log file."""
+        self._render_ticking = False
         self._close_log_file()
 
+    def _on_ui_tick(self):
+        """Once-a-second work shared on one timer: CPU meter, render columns
+        and, every fifth tick, the offline-slave check."""
+        self._tick_count += 1
+        self._update_cpu_usage()
+        if self._render_ticking:
+            self._on_render_timer_tick()
+        if self.master_server and self._tick_count % 5 == 0:
+            self._refresh_slaves_if_dirty()
+
     def _on_render_timer_tick(self):
         """Update Progress and Time columns for all currently rendering jobs."""
         current_jobs = self.queue.current_jobs
         if not current_jobs:
             return
-        job_map = {j.id: j for j in current_jobs}
-        for row in range(self.queue_table.rowCount()):
-            id_item = self.queue_table.item(row, 9)
-            if id_item and id_item.text() in job_map:
-                job = job_map[id_item.text()]
-                self.queue_table.setItem(row, 5, QTableWidgetItem(f"{job.progress:.0f}%"))
-                self.queue_table.setItem(row, 6, QTableWidgetItem(job.elapsed_str))
+        for job in current_jobs:
+            row = self._row_by_id.get(job.id)
+            if row is None:
+                continue
+            self._set_cell_text(row, 5, f"{job.progress:.0f}%")
+            self._set_cell_text(row, 6, job.elapsed_str)
 
     # --- CPU monitor ---
     def _init_cpu_monitor(self):
         """Initialize CPU usage monitoring using Windows GetSystemTimes."""
         self._prev_cpu_times = self._get_system_times()
+        # Also drives the render columns and slaves check, see _on_ui_tick
         self._cpu_timer = QTimer()
-        self._cpu_timer.timeout.connect(self._update_cpu_usage)
+        self._cpu_timer.timeout.connect(self._on_ui_tick)
         self._cpu_timer.start(1000)
 
     def _get_system_times(self):
@@ -3925,56 +4227,41 @@ class MainWindow(QMainWindow):
 
     # --- Single-instance IPC server ---
     def _start_ipc_server(self):
-        """Start a TCP server to receive files from other app instances."""
+        """Start a local socket/pipe listener to receive files from other app instances."""
+        from src.utils.ipc import create_listener
         self._ipc_running = True
-        self._ipc_socket = None
-        try:
-            self._ipc_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self._ipc_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self._ipc_socket.bind(('127.0.0.1', 51780))
-            self._ipc_socket.listen(5)
-            self._ipc_socket.settimeout(1.0)
+        self._ipc_listener = create_listener()
+        if self._ipc_listener:
             self._ipc_thread = threading.Thread(target=self._ipc_listen, daemon=True)
             self._ipc_thread.start()
-        except OSError:
-            # Port unavailable - silently continue without IPC
-            if self._ipc_socket:
-                try:
-                    self._ipc_socket.close()
-                except OSError:
-                    pass
-                self._ipc_socket = None
 
     def _ipc_listen(self):
         """Background thread: accept connections and receive file paths."""
-        while self._ipc_running and self._ipc_socket:
+        from src.utils.ipc import RECV_TIMEOUT
+        while self._ipc_running and self._ipc_listener:
+            try:
+                conn = self._ipc_listener.accept()
+            except OSError:
+                break
             try:
-                conn, addr = self._ipc_socket.accept()
+                data = conn.recv_bytes() if conn.poll(RECV_TIMEOUT) else b""
+            except (EOFError, OSError):
                 data = b""
-                conn.settimeout(5)
-                while True:
-                    chunk = conn.recv(4096)
-                    if not chunk:
-                        break
-                    data += chunk
+            finally:
                 conn.close()
-                if data:
-                    msg = json.loads(data.decode('utf-8'))
-                    files = msg.get("files", [])
-                    if files:
-                        self.ipc_files_signal.emit(files)
-            except socket.timeout:
+            if not data or not self._ipc_running:
                 continue
-            except (OSError, json.JSONDecodeError):
-                break
+            try:
+                msg = json.loads(data.decode('utf-8'))
+            except (ValueError, UnicodeDecodeError):
+                continue
+            files = msg.get("files", [])
+            if files:
+                self.ipc_files_signal.emit(files)
 
     def _on_ipc_files(self, files):
         """Handle files received from another instance via IPC."""
-        count = 0
-        for f in files:
-            if os.path.exists(f):
-                self._add_file_to_queue(f)
-                count += 1
+        count = self._add_files_to_queue(f for f in files if os.path.exists(f))
         if count:
             self._append_log(f"Received {count} file{'s' if count > 1 else ''} from another instance")
         # Bring window to front
@@ -3985,12 +4272,10 @@ class MainWindow(QMainWindow):
     def _stop_ipc_server(self):
         """Stop the IPC server."""
         self._ipc_running = False
-        if self._ipc_socket:
-            try:
-                self._ipc_socket.close()
-            except OSError:
-                pass
-            self._ipc_socket = None
+        if self._ipc_listener:
+            from src.utils.ipc import close_listener
+            close_listener(self._ipc_listener)
+            self._ipc_listener = None
 
     def closeEvent(self, event):
         if self.queue.is_running:
@@ -4006,15 +4291,17 @@ class MainWindow(QMainWindow):
 
         if hasattr(self, '_farm_queue_timer'):
             self._farm_queue_timer.stop()
-        if hasattr(self, '_slave_timer'):
-            self._slave_timer.stop()
         if self.master_server:
             self.master_server.stop()
         if self.slave_client:
             self.slave_client.stop()
 
-        self._close_log_file()
+        # Give the writer a moment to get the last lines to disk
+        self._close_log_file(wait=5)
         self._stop_ipc_server()
+        # Don't lose a queue change whose auto-save was still pending
+        if self._refresh_pending:
+            self._autosave_queue()
 
         # Save settings
         self.config.moho_path = self.edit_moho_path.text()
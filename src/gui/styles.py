@@ -233,6 +233,9 @@ QLabel#subtitleLabel {
     font-size: 11px;
     color: #6c7086;
 }
+QLabel#mutedLabel {
+    color: #a6adc8;
+}
 QStatusBar {
     background-color: #181825;
     color: #a6adc8;
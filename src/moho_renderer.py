@@ -195,9 +195,8 @@ class MohoRenderer:
         # Create a log file for this job if not specified
         log_path = job.log_file
         if not log_path and job.verbose:
-            from src.config import CONFIG_DIR
-            log_dir = CONFIG_DIR / "logs"
-            log_dir.mkdir(parents=True, exist_ok=True)
+            from src.config import CONFIG_DIR, ensure_dir
+            log_dir = ensure_dir(CONFIG_DIR / "logs")
             log_path = str(log_dir / f"render_{job.id}.log")
             # Add log to command if not already there
             if "-log" not in cmd:
@@ -53,6 +53,9 @@ class MasterServer:
     def __init__(self, port: int = 5580):
         self.port = port
         self.slaves: Dict[str, SlaveInfo] = {}
+        # Bumped whenever a slave's displayed fields change, so viewers can
+        # skip redraws when nothing did
+        self.slaves_version = 0
         self.pending_jobs: List[RenderJob] = []
         self.active_jobs: Dict[str, RenderJob] = {}  # slave_address -> job
         self.reserved_jobs: Dict[str, RenderJob] = {}  # slave_address -> reserved job
@@ -73,12 +76,19 @@ class MasterServer:
         self.on_job_failed: Optional[Callable[[RenderJob, SlaveInfo], None]] = None
         self.on_output: Optional[Callable[[str], None]] = None
         self.on_farm_queue_changed: Optional[Callable[[], None]] = None
+        self.on_slaves_changed: Optional[Callable[[], None]] = None
 
         self._app = Flask(__name__)
         self._app.config['MAX_CONTENT_LENGTH'] = 2 * 1024 * 1024 * 1024  # 2 GB
         FARM_FILES_DIR.mkdir(parents=True, exist_ok=True)
         self._setup_routes()
 
+    def _slaves_changed(self):
+        """Record a change to the slave list or a slave's state (call with _lock held)."""
+        self.slaves_version += 1
+        if self.on_slaves_changed:
+            self.on_slaves_changed()
+
     def _notify_queue_changed(self):
         """Fire the queue-changed callback (thread-safe for GUI signal emission)."""
         if self.on_farm_queue_changed:
@@ -102,6 +112,7 @@ class MasterServer:
                     slave = SlaveInfo(hostname, ip, port)
                     slave.render_enabled = render_enabled
                     self.slaves[key] = slave
+                    self._slaves_changed()
                     if self.on_slave_connected:
                         self.on_slave_connected(slave)
                     if self.on_output:
@@ -111,6 +122,7 @@ class MasterServer:
                     self.slaves[key].last_heartbeat = time.time()
                     self.slaves[key].hostname = hostname
                     self.slaves[key].render_enabled = render_enabled
+                    self._slaves_changed()
                     if self.slaves[key].status == "offline":
                         self.slaves[key].status = "idle"
                         if self.on_slave_connected:
@@ -130,12 +142,16 @@ class MasterServer:
             cancel_ids = []
             with self._lock:
                 if key in self.slaves:
-                    self.slaves[key].last_heartbeat = time.time()
-                    self.slaves[key].status = data.get("status", "idle")
+                    slave = self.slaves[key]
+                    before = (slave.status, slave.render_enabled)
+                    slave.last_heartbeat = time.time()
+                    slave.status = data.get("status", "idle")
                     # Update render_enabled from slave (only if not overridden by master)
                     slave_render = data.get("render_enabled", True)
                     if slave_render is False:
-                        self.slaves[key].render_enabled = False
+                        slave.render_enabled = False
+                    if (slave.status, slave.render_enabled) != before:
+                        self._slaves_changed()
                 if key in self.active_jobs and self._cancel_requests:
                     job = self.active_jobs[key]
                     if job.id in self._cancel_requests:
@@ -182,6 +198,7 @@ class MasterServer:
                     self.active_jobs[key] = job
                     self.slaves[key].status = "rendering"
                     self.slaves[key].current_job_id = job.id
+                    self._slaves_changed()
 
                     if self.on_job_assigned:
                         self.on_job_assigned(job, self.slaves[key])
@@ -249,6 +266,7 @@ class MasterServer:
                 if key in self.slaves:
                     self.slaves[key].status = "idle"
                     self.slaves[key].current_job_id = ""
+                    self._slaves_changed()
 
             self._notify_queue_changed()
             return jsonify({"status": "ok"})
@@ -483,6 +501,7 @@ class MasterServer:
         with self._lock:
             if slave_address in self.slaves:
                 self.slaves[slave_address].render_enabled = enabled
+                self._slaves_changed()
                 if self.on_output:
                     name = self.slaves[slave_address].hostname
                     state = "enabled" if enabled else "disabled"
@@ -24,6 +24,7 @@ class SlaveClient:
         self.hostname = socket.gethostname()
         self._max_concurrent = max(1, max_concurrent)
         self._running = False
+        self.stopped_event = threading.Event()
         self._workers: List[threading.Thread] = []
         self._heartbeat_thread = None
         self._lock = threading.Lock()
@@ -61,6 +62,7 @@ class SlaveClient:
         if self._running:
             return
         self._running = True
+        self.stopped_event.clear()
         mode = "render+submit" if self.render_enabled else "submit-only"
         if self.on_output:
             self.on_output(f"Starting slave ({mode} mode, {self._max_concurrent} workers)")
@@ -85,6 +87,7 @@ class SlaveClient:
         for t in self._workers:
             t.join(timeout=10)
         self._workers = []
+        self.stopped_event.set()
 
     def _register(self) -> bool:
         """Register with the master server."""
@@ -295,12 +298,13 @@ class SlaveClient:
         if (job.status == RenderStatus.COMPLETED.value
                 and job.compose_layers and job.layercomp):
             try:
-                from src.ffmpeg_compose import compose_layer_comps
+                from src.ffmpeg_compose import compose_layer_comps, threads_per_job
                 out_dir = Path(job.output_path).parent if job.output_path else Path(job.project_file).parent
                 if self.on_output:
                     self.on_output(f"Worker {worker_id}: Starting ffmpeg layer composition...")
                 compose_layer_comps(str(out_dir), on_output=self.on_output,
-                                    reverse_order=job.compose_reverse_order)
+                                    reverse_order=job.compose_reverse_order,
+                                    threads=threads_per_job(self._max_concurrent))
             except Exception as e:
                 if self.on_output:
                     self.on_output(f"Worker {worker_id}: FFmpeg compose error: {e}")
@@ -4,6 +4,7 @@ import threading
 import time
 from pathlib import Path
 from typing import Optional, Callable, List, Dict, Tuple
+from src.config import ensure_dir
 from src.moho_renderer import RenderJob, RenderStatus, MohoRenderer
 
 
@@ -17,6 +18,7 @@ class RenderQueue:
         self._running = False
         self._paused = False
         self._lock = threading.Lock()
+        self.completed_event = threading.Event()  # Set when workers finish or stop
 
         # Multi-worker state
         self._workers: List[threading.Thread] = []
@@ -48,6 +50,16 @@ class RenderQueue:
             self.on_queue_changed()
         return job
 
+    def add_jobs(self, jobs: List[RenderJob]) -> List[RenderJob]:
+        """Add several jobs to the queue with a single change notification."""
+        if not jobs:
+            return jobs
+        with self._lock:
+            self.jobs.extend(jobs)
+        if self.on_queue_changed:
+            self.on_queue_changed()
+        return jobs
+
     def remove_job(self, job_id: str) -> bool:
         """Remove a job from the queue by ID."""
         with self._lock:
@@ -106,6 +118,7 @@ class RenderQueue:
             return
         self._running = True
         self._paused = False
+        self.completed_event.clear()
         self._workers_done = 0
         self._workers = []
         for i in range(self._max_concurrent):
@@ -133,6 +146,7 @@ class RenderQueue:
             return
         self._running = True
         self._paused = False
+        self.completed_event.clear()
         self._workers_done = 0
         self._workers = []
         for i in range(min(self._max_concurrent, found)):
@@ -150,6 +164,7 @@ class RenderQueue:
         for t in self._workers:
             t.join(timeout=10)
         self._workers = []
+        self.completed_event.set()
 
     def pause(self):
         """Pause queue processing (finishes current jobs)."""
@@ -260,12 +275,13 @@ class RenderQueue:
                 if (next_job.status == RenderStatus.COMPLETED.value
                         and next_job.compose_layers and next_job.layercomp):
                     try:
-                        from src.ffmpeg_compose import compose_layer_comps
+                        from src.ffmpeg_compose import compose_layer_comps, threads_per_job
                         out_dir = Path(next_job.output_path).parent if next_job.output_path else Path(next_job.project_file).parent
                         if self.on_output:
                             self.on_output(f"[{next_job.id}] Starting ffmpeg layer composition...")
                         compose_layer_comps(str(out_dir), on_output=self.on_output,
-                                            reverse_order=next_job.compose_reverse_order)
+                                            reverse_order=next_job.compose_reverse_order,
+                                            threads=threads_per_job(self._max_concurrent))
                     except Exception as e:
                         if self.on_output:
                             self.on_output(f"[{next_job.id}] FFmpeg compose error: {e}")
@@ -294,21 +310,32 @@ class RenderQueue:
                     self._running = False
                     all_done = True
 
-        if all_done and self.on_queue_completed:
-            self.on_queue_completed()
+        if all_done:
+            if self.on_queue_completed:
+                self.on_queue_completed()
+            self.completed_event.set()
 
     def _run_compose_only(self, job: RenderJob):
         """Run an FFmpeg compose-only job (no Moho render)."""
         import time as _time
         job.start_time = _time.time()
         try:
-            from src.ffmpeg_compose import compose_layer_comps
+            from src.ffmpeg_compose import compose_layer_comps, threads_per_job
             if self.on_output:
                 self.on_output(f"[{job.id}] Starting ffmpeg layer composition: {job.output_path}")
+
+            def _on_progress(progress):
+                job.progress = progress
+                if self.on_progress:
+                    self.on_progress(job, progress)
+
+            # Compose-only jobs run side by side when max_concurrent > 1
             result = compose_layer_comps(
                 str(job.output_path),
                 on_output=self.on_output,
+                on_progress=_on_progress,
                 reverse_order=job.compose_reverse_order,
+                threads=threads_per_job(self._max_concurrent),
             )
             job.end_time = _time.time()
             if result:
@@ -330,6 +357,7 @@ class RenderQueue:
             "version": "1.0",
             "jobs": [job.to_dict() for job in self.jobs],
         }
+        ensure_dir(Path(filepath).parent)
         with open(filepath, "w", encoding="utf-8") as f:
             json.dump(data, f, indent=2, ensure_ascii=False)
 
@@ -0,0 +1,45 @@
+"""Reveal files in Windows Explorer through the shell API."""
+import ctypes
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def _shell_api():
+    """Load the shell32/ole32 entry points once, with their signatures set."""
+    shell32 = ctypes.windll.shell32
+    ole32 = ctypes.windll.ole32
+
+    parse = shell32.SHParseDisplayName
+    parse.argtypes = [ctypes.c_wchar_p, ctypes.c_void_p, ctypes.POINTER(ctypes.c_void_p),
+                      ctypes.c_ulong, ctypes.c_void_p]
+    parse.restype = ctypes.c_long
+
+    select = shell32.SHOpenFolderAndSelectItems
+    select.argtypes = [ctypes.c_void_p, ctypes.c_uint, ctypes.c_void_p, ctypes.c_ulong]
+    select.restype = ctypes.c_long
+
+    free = ole32.CoTaskMemFree
+    free.argtypes = [ctypes.c_void_p]
+    free.restype = None
+    return parse, select, free
+
+
+def reveal_in_explorer(filepath: str) -> bool:
+    """Open an Explorer window with filepath selected.
+
+    Asks the running shell directly instead of starting a new explorer.exe.
+    Must be called on a thread with COM initialized (the Qt GUI thread is).
+    Returns False if the shell call is unavailable or fails, so the caller
+    can fall back to `explorer /select,`.
+    """
+    try:
+        parse, select, free = _shell_api()
+    except (AttributeError, OSError):
+        return False
+    pidl = ctypes.c_void_p()
+    if parse(filepath, None, ctypes.byref(pidl), 0, None) != 0 or not pidl:
+        return False
+    try:
+        return select(pidl, 0, None, 0) == 0
+    finally:
+        free(pidl)
@@ -0,0 +1,111 @@
+"""Single-instance IPC between app launches.
+
+Uses a Unix domain socket on POSIX and a named pipe on Windows, so handing
+file paths to a running instance never goes through the loopback TCP stack.
+"""
+import os
+import sys
+import json
+
+try:
+    import orjson  # Optional: encodes straight to bytes
+except ImportError:
+    orjson = None
+
+PIPE_NAME = r"\\.\pipe\MohoRenderFarm"
+SOCKET_NAME = "ipc.sock"
+
+# Seconds a client may take to connect, and the listener waits for a
+# connected client's payload, so one stuck peer can't hold up the others
+CONNECT_TIMEOUT = 0.1
+RECV_TIMEOUT = 0.5
+
+
+def get_ipc_address():
+    """Return (address, family) for the single-instance listener."""
+    if sys.platform == "win32":
+        return PIPE_NAME, "AF_PIPE"
+    from src.config import CONFIG_DIR
+    return str(CONFIG_DIR / SOCKET_NAME), "AF_UNIX"
+
+
+def _connect(address, family):
+    """Open a Connection to the listener, raising OSError on failure.
+
+    Unix sockets connect with a CONNECT_TIMEOUT bound; multiprocessing's
+    Client has none. Named pipes fail at once when no instance is running.
+    """
+    from multiprocessing.connection import Client, Connection
+
+    if family != "AF_UNIX":
+        return Client(address, family=family)
+    import socket
+    s = socket.socket(socket.AF_UNIX)
+    try:
+        s.settimeout(CONNECT_TIMEOUT)
+        s.connect(address)
+        s.settimeout(None)
+        return Connection(s.detach())
+    except OSError:
+        s.close()
+        raise
+
+
+def send_files(files):
+    """Send file paths to a running instance. Returns True if delivered."""
+    # Serialize before connecting so the payload goes out in one write
+    cwd = os.getcwd()
+    paths = [f if os.path.isabs(f) else os.path.normpath(os.path.join(cwd, f)) for f in files]
+    if orjson:
+        data = orjson.dumps({"files": paths})
+    else:
+        data = json.dumps({"files": paths}).encode("utf-8")
+    address, family = get_ipc_address()
+    try:
+        conn = _connect(address, family)
+    except OSError:
+        return False
+    try:
+        conn.send_bytes(data)
+        return True
+    except OSError:
+        return False
+    finally:
+        conn.close()
+
+
+def create_listener():
+    """Create the IPC listener, or return None if another instance owns it."""
+    from multiprocessing.connection import Listener
+
+    address, family = get_ipc_address()
+    if family == "AF_UNIX":
+        from src.config import ensure_dir
+        ensure_dir(os.path.dirname(address))
+    if family == "AF_UNIX" and os.path.exists(address):
+        try:
+            # A live instance accepts the connection; a stale socket refuses it
+            _connect(address, family).close()
+            return None
+        except OSError:
+            try:
+                os.unlink(address)
+            except OSError:
+                return None
+    try:
+        return Listener(address, family=family)
+    except OSError:
+        return None
+
+
+def close_listener(listener):
+    """Close the listener, waking a thread blocked in accept()."""
+    address, family = get_ipc_address()
+    try:
+        _connect(address, family).close()
+    except OSError:
+        pass
+    try:
+        listener.close()
+    except OSError:
+        pass